@@ -7,8 +7,8 @@ environments we apply a small set of module-level pylint disables.
 """
 
 # top-level imports
-from .controller_device import Joystick, PyGameJoystick, Channel, RCReceiver
-import os
+from .controller_device import Joystick, PyGameJoystick, Channel, RCReceiver, \
+    joystick_profile
 # Module-level lint relaxations for hardware abstraction layer.
 # These are deliberate to reduce noise from optional deps and large
 # controller wiring logic while keeping behavior unchanged.
@@ -16,11 +16,11 @@ import os
 # pylint: disable=too-many-public-methods,too-many-arguments,unused-import,
 # pylint: disable=unused-variable,redefined-outer-name,broad-except,bare-except,superfluous-parens,redefined-builtin,duplicate-key,
 # pylint: disable=missing-function-docstring,no-else-return,invalid-name,too-few-public-methods,pointless-string-statement,logging-not-lazy,logging-fstring-interpolation
-import array
+import sys
 import time
 import struct
-import random
-from threading import Thread
+from collections import deque
+from threading import current_thread
 import logging
 
 try:
@@ -29,12 +29,29 @@ except Exception:  # pragma: no cover - optional dev dependency
     class PrettyTable:  # minimal fallback for tests/CI
         def __init__(self, *args, **kwargs):
             self._rows = []
+            self.field_names = []
 
         def add_row(self, row):
             self._rows.append(row)
 
+        def _lines(self):
+            # yield formatted lines lazily rather than building a list
+            if self.field_names:
+                yield ' | '.join(map(str, self.field_names))
+            for row in self._rows:
+                yield ' | '.join(map(str, row))
+
+        def __str__(self):
+            return '\n'.join(self._lines())
+
         def get_string(self):
-            return '\n'.join(str(r) for r in self._rows)
+            return str(self)
+
+# zmq is only needed by the networked joystick parts
+try:
+    import zmq
+except ModuleNotFoundError:
+    zmq = None
 
 # import for syntactical ease
 from donkeycar.parts.web_controller.web import LocalWebController
@@ -66,198 +83,234 @@ class JoystickCreator(Joystick):
         return button, button_state, axis, axis_val
 
 
+@joystick_profile(
+    axis_names={
+        0x00: 'left_stick_horz',
+        0x01: 'left_stick_vert',
+        0x02: 'right_stick_horz',
+        0x03: 'right_stick_vert',
+    },
+    button_names={
+        0x120: 'select',
+        0x123: 'start',
+        0x130: 'PS',
+
+        0x12a: 'L1',
+        0x12b: 'R1',
+        0x128: 'L2',
+        0x129: 'R2',
+        0x121: 'L3',
+        0x122: 'R3',
+
+        0x12c: "triangle",
+        0x12d: "circle",
+        0x12e: "cross",
+        0x12f: 'square',
+
+        0x124: 'dpad_up',
+        0x126: 'dpad_down',
+        0x127: 'dpad_left',
+        0x125: 'dpad_right',
+    },
+)
 class PS3JoystickSixAd(Joystick):
     '''
     An interface to a physical PS3 joystick available at /dev/input/js0
     Contains mapping that worked for Jetson Nano using sixad for PS3 controller's connection 
     '''
 
-    def __init__(self, *args, **kwargs):
-        super(PS3JoystickSixAd, self).__init__(*args, **kwargs)
-
-        self.axis_names = {
-            0x00: 'left_stick_horz',
-            0x01: 'left_stick_vert',
-            0x02: 'right_stick_horz',
-            0x03: 'right_stick_vert',
-        }
-
-        self.button_names = {
-            0x120: 'select',
-            0x123: 'start',
-            0x130: 'PS',
-
-            0x12a: 'L1',
-            0x12b: 'R1',
-            0x128: 'L2',
-            0x129: 'R2',
-            0x121: 'L3',
-            0x122: 'R3',
-
-            0x12c: "triangle",
-            0x12d: "circle",
-            0x12e: "cross",
-            0x12f: 'square',
-
-            0x124: 'dpad_up',
-            0x126: 'dpad_down',
-            0x127: 'dpad_left',
-            0x125: 'dpad_right',
-        }
-
 
+@joystick_profile(
+    axis_names={
+        0x00: 'left_stick_horz',
+        0x01: 'left_stick_vert',
+        0x02: 'right_stick_horz',
+        0x05: 'right_stick_vert',
+
+        0x1a: 'tilt_x',
+        0x1b: 'tilt_y',
+        0x3d: 'tilt_a',
+        0x3c: 'tilt_b',
+
+        0x32: 'L1_pressure',
+        0x33: 'R1_pressure',
+        0x31: 'R2_pressure',
+        0x30: 'L2_pressure',
+
+        0x36: 'cross_pressure',
+        0x35: 'circle_pressure',
+        0x37: 'square_pressure',
+        0x34: 'triangle_pressure',
+
+        0x2d: 'dpad_r_pressure',
+        0x2e: 'dpad_d_pressure',
+        0x2c: 'dpad_u_pressure',
+    },
+    button_names={
+        0x120: 'select',
+        0x123: 'start',
+        0x2c0: 'PS',
+
+        0x12a: 'L1',
+        0x12b: 'R1',
+        0x128: 'L2',
+        0x129: 'R2',
+        0x121: 'L3',
+        0x122: 'R3',
+
+        0x12c: "triangle",
+        0x12d: "circle",
+        0x12e: "cross",
+        0x12f: 'square',
+
+        0x124: 'dpad_up',
+        0x126: 'dpad_down',
+        0x127: 'dpad_left',
+        0x125: 'dpad_right',
+    },
+)
 class PS3JoystickOld(Joystick):
     '''
     An interface to a physical PS3 joystick available at /dev/input/js0
     Contains mapping that worked for Raspian Jessie drivers
     '''
 
-    def __init__(self, *args, **kwargs):
-        super(PS3JoystickOld, self).__init__(*args, **kwargs)
-
-        self.axis_names = {
-            0x00: 'left_stick_horz',
-            0x01: 'left_stick_vert',
-            0x02: 'right_stick_horz',
-            0x05: 'right_stick_vert',
-
-            0x1a: 'tilt_x',
-            0x1b: 'tilt_y',
-            0x3d: 'tilt_a',
-            0x3c: 'tilt_b',
-
-            0x32: 'L1_pressure',
-            0x33: 'R1_pressure',
-            0x31: 'R2_pressure',
-            0x30: 'L2_pressure',
-
-            0x36: 'cross_pressure',
-            0x35: 'circle_pressure',
-            0x37: 'square_pressure',
-            0x34: 'triangle_pressure',
-
-            0x2d: 'dpad_r_pressure',
-            0x2e: 'dpad_d_pressure',
-            0x2c: 'dpad_u_pressure',
-        }
-
-        self.button_names = {
-            0x120: 'select',
-            0x123: 'start',
-            0x2c0: 'PS',
-
-            0x12a: 'L1',
-            0x12b: 'R1',
-            0x128: 'L2',
-            0x129: 'R2',
-            0x121: 'L3',
-            0x122: 'R3',
-
-            0x12c: "triangle",
-            0x12d: "circle",
-            0x12e: "cross",
-            0x12f: 'square',
-
-            0x124: 'dpad_up',
-            0x126: 'dpad_down',
-            0x127: 'dpad_left',
-            0x125: 'dpad_right',
-        }
-
 
+@joystick_profile(
+    axis_names={
+        0x00: 'left_stick_horz',
+        0x01: 'left_stick_vert',
+        0x03: 'right_stick_horz',
+        0x04: 'right_stick_vert',
+
+        0x02: 'L2_pressure',
+        0x05: 'R2_pressure',
+    },
+    button_names={
+        0x13a: 'select',  # 8 314
+        0x13b: 'start',  # 9 315
+        0x13c: 'PS',  # a  316
+
+        0x136: 'L1',  # 4 310
+        0x137: 'R1',  # 5 311
+        0x138: 'L2',  # 6 312
+        0x139: 'R2',  # 7 313
+        0x13d: 'L3',  # b 317
+        0x13e: 'R3',  # c 318
+
+        0x133: "triangle",  # 2 307
+        0x131: "circle",  # 1 305
+        0x130: "cross",  # 0 304
+        0x134: 'square',  # 3 308
+
+        0x220: 'dpad_up',  # d 544
+        0x221: 'dpad_down',  # e 545
+        0x222: 'dpad_left',  # f 546
+        0x223: 'dpad_right',  # 10 547
+    },
+)
 class PS3Joystick(Joystick):
     '''
     An interface to a physical PS3 joystick available at /dev/input/js0
     Contains mapping that work for Raspian Stretch drivers
     '''
 
-    def __init__(self, *args, **kwargs):
-        super(PS3Joystick, self).__init__(*args, **kwargs)
-
-        self.axis_names = {
-            0x00: 'left_stick_horz',
-            0x01: 'left_stick_vert',
-            0x03: 'right_stick_horz',
-            0x04: 'right_stick_vert',
-
-            0x02: 'L2_pressure',
-            0x05: 'R2_pressure',
-        }
-
-        self.button_names = {
-            0x13a: 'select',  # 8 314
-            0x13b: 'start',  # 9 315
-            0x13c: 'PS',  # a  316
-
-            0x136: 'L1',  # 4 310
-            0x137: 'R1',  # 5 311
-            0x138: 'L2',  # 6 312
-            0x139: 'R2',  # 7 313
-            0x13d: 'L3',  # b 317
-            0x13e: 'R3',  # c 318
-
-            0x133: "triangle",  # 2 307
-            0x131: "circle",  # 1 305
-            0x130: "cross",  # 0 304
-            0x134: 'square',  # 3 308
-
-            0x220: 'dpad_up',  # d 544
-            0x221: 'dpad_down',  # e 545
-            0x222: 'dpad_left',  # f 546
-            0x223: 'dpad_right',  # 10 547
-        }
-
 
+@joystick_profile(
+    axis_names={
+        0x00: 'left_stick_horz',
+        0x01: 'left_stick_vert',
+        0x03: 'right_stick_horz',
+        0x04: 'right_stick_vert',
+
+        0x02: 'left_trigger_axis',
+        0x05: 'right_trigger_axis',
+
+        0x10: 'dpad_leftright',
+        0x11: 'dpad_updown',
+
+        0x19: 'tilt_a',
+        0x1a: 'tilt_b',
+        0x1b: 'tilt_c',
+
+        0x06: 'motion_a',
+        0x07: 'motion_b',
+        0x08: 'motion_c',
+    },
+    button_names={
+        0x134: 'square',
+        0x130: 'cross',
+        0x131: 'circle',
+        0x133: 'triangle',
+
+        0x138: 'L1',
+        0x139: 'R1',
+        0x136: 'L2',
+        0x137: 'R2',
+        0x13a: 'L3',
+        0x13b: 'R3',
+
+        0x13d: 'pad',
+        0x13a: 'share',
+        0x13b: 'options',
+        0x13c: 'PS',
+    },
+)
 class PS4Joystick(Joystick):
     '''
     An interface to a physical PS4 joystick available at /dev/input/js0
     '''
 
-    def __init__(self, *args, **kwargs):
-        super(PS4Joystick, self).__init__(*args, **kwargs)
-
-        self.axis_names = {
-            0x00: 'left_stick_horz',
-            0x01: 'left_stick_vert',
-            0x03: 'right_stick_horz',
-            0x04: 'right_stick_vert',
-
-            0x02: 'left_trigger_axis',
-            0x05: 'right_trigger_axis',
-
-            0x10: 'dpad_leftright',
-            0x11: 'dpad_updown',
-
-            0x19: 'tilt_a',
-            0x1a: 'tilt_b',
-            0x1b: 'tilt_c',
-
-            0x06: 'motion_a',
-            0x07: 'motion_b',
-            0x08: 'motion_c',
-        }
-
-        self.button_names = {
-
-            0x134: 'square',
-            0x130: 'cross',
-            0x131: 'circle',
-            0x133: 'triangle',
-
-            0x138: 'L1',
-            0x139: 'R1',
-            0x136: 'L2',
-            0x137: 'R2',
-            0x13a: 'L3',
-            0x13b: 'R3',
-
-            0x13d: 'pad',
-            0x13a: 'share',
-            0x13b: 'options',
-            0x13c: 'PS',
-        }
-
 
+@joystick_profile(
+    axis_names={
+        0x00: 'left_stick_horz',
+        0x01: 'left_stick_vert',
+        0x03: 'right_stick_horz',
+        0x04: 'right_stick_vert',
+
+        0x1a: 'tilt_x',
+        0x1b: 'tilt_y',
+        0x3d: 'tilt_a',
+        0x3c: 'tilt_b',
+
+        0x32: 'L1_pressure',
+        0x33: 'R1_pressure',
+        0x05: 'R2_pressure',
+        0x02: 'L2_pressure',
+
+        0x36: 'cross_pressure',
+        0x35: 'circle_pressure',
+        0x37: 'square_pressure',
+        0x34: 'triangle_pressure',
+
+        0x2d: 'dpad_r_pressure',
+        0x2e: 'dpad_d_pressure',
+        0x2c: 'dpad_u_pressure',
+    },
+    button_names={
+        0x13a: 'select',
+        0x13b: 'start',
+        0x13c: 'PS',
+
+        0x136: 'L1',
+        0x137: 'R1',
+        0x138: 'L2',
+        0x139: 'R2',
+        0x13d: 'L3',
+        0x13e: 'R3',
+
+        0x133: "triangle",
+        0x131: "circle",
+        0x130: "cross",
+        0x134: 'square',
+
+        0x220: 'dpad_up',
+        0x221: 'dpad_down',
+        0x222: 'dpad_left',
+        0x223: 'dpad_right',
+    },
+)
 class PS3JoystickPC(Joystick):
     '''
     An interface to a physical PS3 joystick available at /dev/input/js1
@@ -267,98 +320,64 @@ class PS3JoystickPC(Joystick):
     It also wants /dev/input/js1 device filename, not js0
     '''
 
-    def __init__(self, *args, **kwargs):
-        super(PS3JoystickPC, self).__init__(*args, **kwargs)
-
-        self.axis_names = {
-            0x00: 'left_stick_horz',
-            0x01: 'left_stick_vert',
-            0x03: 'right_stick_horz',
-            0x04: 'right_stick_vert',
-
-            0x1a: 'tilt_x',
-            0x1b: 'tilt_y',
-            0x3d: 'tilt_a',
-            0x3c: 'tilt_b',
-
-            0x32: 'L1_pressure',
-            0x33: 'R1_pressure',
-            0x05: 'R2_pressure',
-            0x02: 'L2_pressure',
-
-            0x36: 'cross_pressure',
-            0x35: 'circle_pressure',
-            0x37: 'square_pressure',
-            0x34: 'triangle_pressure',
-
-            0x2d: 'dpad_r_pressure',
-            0x2e: 'dpad_d_pressure',
-            0x2c: 'dpad_u_pressure',
-        }
-
-        self.button_names = {
-            0x13a: 'select',
-            0x13b: 'start',
-            0x13c: 'PS',
-
-            0x136: 'L1',
-            0x137: 'R1',
-            0x138: 'L2',
-            0x139: 'R2',
-            0x13d: 'L3',
-            0x13e: 'R3',
-
-            0x133: "triangle",
-            0x131: "circle",
-            0x130: "cross",
-            0x134: 'square',
-
-            0x220: 'dpad_up',
-            0x221: 'dpad_down',
-            0x222: 'dpad_left',
-            0x223: 'dpad_right',
-        }
-
 
+@joystick_profile(
+    axis_names={
+        0x00: 'left_stick_horz',
+        0x01: 'left_stick_vert',
+        0x03: 'right_stick_vert',
+        0x02: 'right_stick_horz',
+    },
+    button_names={
+        2: "circle",
+        1: "cross",
+        0: 'square',
+        3: "triangle",
+
+        8: 'share',
+        9: 'options',
+        13: 'pad',
+
+        4: 'L1',
+        5: 'R1',
+        6: 'L2',
+        7: 'R2',
+        10: 'L3',
+        11: 'R3',
+        14: 'dpad_left',
+        15: 'dpad_right',
+        16: 'dpad_down',
+        17: 'dpad_up',
+    },
+)
 class PyGamePS4Joystick(PyGameJoystick):
     '''
     An interface to a physical PS4 joystick available via pygame
     Windows setup: https://github.com/nefarius/ScpToolkit/releases/tag/v1.6.238.16010
     '''
 
-    def __init__(self, *args, **kwargs):
-        super(PyGamePS4Joystick, self).__init__(*args, **kwargs)
-
-        self.axis_names = {
-            0x00: 'left_stick_horz',
-            0x01: 'left_stick_vert',
-            0x03: 'right_stick_vert',
-            0x02: 'right_stick_horz',
-        }
-
-        self.button_names = {
-            2: "circle",
-            1: "cross",
-            0: 'square',
-            3: "triangle",
-
-            8: 'share',
-            9: 'options',
-            13: 'pad',
-
-            4: 'L1',
-            5: 'R1',
-            6: 'L2',
-            7: 'R2',
-            10: 'L3',
-            11: 'R3',
-            14: 'dpad_left',
-            15: 'dpad_right',
-            16: 'dpad_down',
-            17: 'dpad_up',
-        }
-
 
+@joystick_profile(
+    axis_names={
+        0x00: 'left_stick_horz',
+        0x01: 'left_stick_vert',
+        0x05: 'right_stick_vert',
+        0x02: 'right_stick_horz',
+        0x0a: 'left_trigger',
+        0x09: 'right_trigger',
+        0x10: 'dpad_horiz',
+        0x11: 'dpad_vert'
+    },
+    button_names={
+        0x130: 'a_button',
+        0x131: 'b_button',
+        0x133: 'x_button',
+        0x134: 'y_button',
+        0x13b: 'options',
+        0x136: 'left_shoulder',
+        0x137: 'right_shoulder',
+    },
+)
 class XboxOneJoystick(Joystick):
     '''
     An interface to a physical joystick 'Xbox Wireless Controller' controller.
@@ -379,31 +398,37 @@ class XboxOneJoystick(Joystick):
     https://github.com/Ezward/donkeypart_ps3_controller/blob/master/donkeypart_ps3_controller/part.py
     '''
 
-    def __init__(self, *args, **kwargs):
-        super(XboxOneJoystick, self).__init__(*args, **kwargs)
-
-        self.axis_names = {
-            0x00: 'left_stick_horz',
-            0x01: 'left_stick_vert',
-            0x05: 'right_stick_vert',
-            0x02: 'right_stick_horz',
-            0x0a: 'left_trigger',
-            0x09: 'right_trigger',
-            0x10: 'dpad_horiz',
-            0x11: 'dpad_vert'
-        }
-
-        self.button_names = {
-            0x130: 'a_button',
-            0x131: 'b_button',
-            0x133: 'x_button',
-            0x134: 'y_button',
-            0x13b: 'options',
-            0x136: 'left_shoulder',
-            0x137: 'right_shoulder',
-        }
-
 
+@joystick_profile(
+    axis_names={
+        0x00: 'left_stick_horz',
+        0x01: 'left_stick_vert',
+        0x03: 'right_stick_horz',
+        0x04: 'right_stick_vert',
+
+        0x02: 'L2_pressure',
+        0x05: 'R2_pressure',
+
+        0x10: 'dpad_leftright',  # 1 is right, -1 is left
+        0x11: 'dpad_up_down',  # 1 is down, -1 is up
+    },
+    button_names={
+        0x13a: 'back',  # 8 314
+        0x13b: 'start',  # 9 315
+        0x13c: 'Logitech',  # a  316
+
+        0x130: 'A',
+        0x131: 'B',
+        0x133: 'X',
+        0x134: 'Y',
+
+        0x136: 'L1',
+        0x137: 'R1',
+
+        0x13d: 'left_stick_press',
+        0x13e: 'right_stick_press',
+    },
+)
 class LogitechJoystick(Joystick):
     '''
     An interface to a physical Logitech joystick available at /dev/input/js0
@@ -414,118 +439,82 @@ class LogitechJoystick(Joystick):
     https://github.com/kevkruemp/donkeypart_logitech_controller/blob/master/donkeypart_logitech_controller/part.py
     '''
 
-    def __init__(self, *args, **kwargs):
-        super(LogitechJoystick, self).__init__(*args, **kwargs)
-
-        self.axis_names = {
-            0x00: 'left_stick_horz',
-            0x01: 'left_stick_vert',
-            0x03: 'right_stick_horz',
-            0x04: 'right_stick_vert',
-
-            0x02: 'L2_pressure',
-            0x05: 'R2_pressure',
-
-            0x10: 'dpad_leftright',  # 1 is right, -1 is left
-            0x11: 'dpad_up_down',  # 1 is down, -1 is up
-        }
-
-        self.button_names = {
-            0x13a: 'back',  # 8 314
-            0x13b: 'start',  # 9 315
-            0x13c: 'Logitech',  # a  316
-
-            0x130: 'A',
-            0x131: 'B',
-            0x133: 'X',
-            0x134: 'Y',
-
-            0x136: 'L1',
-            0x137: 'R1',
-
-            0x13d: 'left_stick_press',
-            0x13e: 'right_stick_press',
-        }
-
 
+@joystick_profile(
+    axis_names={
+        0x0: 'lx',
+        0x1: 'ly',
+        0x2: 'rx',
+        0x5: 'ry',
+        0x11: 'hmm',
+        0x10: 'what',
+    },
+    button_names={
+        0x130: 'a',
+        0x131: 'b',
+        0x132: 'x',
+        0x133: 'y',
+        0x135: 'R1',
+        0x137: 'R2',
+        0x134: 'L1',
+        0x136: 'L2',
+    },
+)
 class Nimbus(Joystick):
     # An interface to a physical joystick available at /dev/input/js0
     # contains mappings that work for the SteelNimbus joystick
     # on Jetson TX2, JetPack 4.2, Ubuntu 18.04
-    def __init__(self, *args, **kwargs):
-        super(Nimbus, self).__init__(*args, **kwargs)
-
-        self.button_names = {
-            0x130: 'a',
-            0x131: 'b',
-            0x132: 'x',
-            0x133: 'y',
-            0x135: 'R1',
-            0x137: 'R2',
-            0x134: 'L1',
-            0x136: 'L2',
-        }
-
-        self.axis_names = {
-            0x0: 'lx',
-            0x1: 'ly',
-            0x2: 'rx',
-            0x5: 'ry',
-            0x11: 'hmm',
-            0x10: 'what',
-        }
-
-
+    pass
+
+
+@joystick_profile(
+    axis_names={
+        0: 'LEFT_STICK_X',
+        1: 'LEFT_STICK_Y',
+        3: 'RIGHT_STICK_X',
+        4: 'RIGHT_STICK_Y',
+    },
+    button_names={
+        305: 'A',
+        304: 'B',
+        307: 'X',
+        308: 'Y',
+        312: 'LEFT_BOTTOM_TRIGGER',
+        310: 'LEFT_TOP_TRIGGER',
+        313: 'RIGHT_BOTTOM_TRIGGER',
+        311: 'RIGHT_TOP_TRIGGER',
+        317: 'LEFT_STICK_PRESS',
+        318: 'RIGHT_STICK_PRESS',
+        314: 'SELECT',
+        315: 'START',
+        547: 'PAD_RIGHT',
+        546: 'PAD_LEFT',
+        544: 'PAD_UP',
+        548: 'PAD_DOWN,',
+    },
+)
 class WiiU(Joystick):
     # An interface to a physical joystick available at /dev/input/js0
     # contains mappings may work for the WiiUPro joystick
     # This was taken from
     # https://github.com/autorope/donkeypart_bluetooth_game_controller/blob/master/donkeypart_bluetooth_game_controller/wiiu_config.yml
     # and need testing!
-    def __init__(self, *args, **kwargs):
-        super(WiiU, self).__init__(*args, **kwargs)
-
-        self.button_names = {
-            305: 'A',
-            304: 'B',
-            307: 'X',
-            308: 'Y',
-            312: 'LEFT_BOTTOM_TRIGGER',
-            310: 'LEFT_TOP_TRIGGER',
-            313: 'RIGHT_BOTTOM_TRIGGER',
-            311: 'RIGHT_TOP_TRIGGER',
-            317: 'LEFT_STICK_PRESS',
-            318: 'RIGHT_STICK_PRESS',
-            314: 'SELECT',
-            315: 'START',
-            547: 'PAD_RIGHT',
-            546: 'PAD_LEFT',
-            544: 'PAD_UP',
-            548: 'PAD_DOWN,',
-        }
-
-        self.axis_names = {
-            0: 'LEFT_STICK_X',
-            1: 'LEFT_STICK_Y',
-            3: 'RIGHT_STICK_X',
-            4: 'RIGHT_STICK_Y',
-        }
-
-
+    pass
+
+
+@joystick_profile(
+    axis_names={
+        0x1: 'Throttle',
+        0x0: 'Steering',
+    },
+    button_names={
+        0x120: 'Switch-up',
+        0x121: 'Switch-down',
+    },
+)
 class RC3ChanJoystick(Joystick):
     # An interface to a physical joystick available at /dev/input/js0
-    def __init__(self, *args, **kwargs):
-        super(RC3ChanJoystick, self).__init__(*args, **kwargs)
-
-        self.button_names = {
-            0x120: 'Switch-up',
-            0x121: 'Switch-down',
-        }
-
-        self.axis_names = {
-            0x1: 'Throttle',
-            0x0: 'Steering',
-        }
+    pass
 
 
 class JoystickController(object):
@@ -545,6 +534,9 @@ class JoystickController(object):
     ES_THROTTLE_POS_ONE = 2
     ES_THROTTLE_NEG_TWO = 3
 
+    # trigger maps up to this size are dispatched by linear scan
+    SMALL_TRIGGER_MAP_SIZE = 8
+
     def __init__(self, poll_delay=0.0,
                  throttle_scale=1.0,
                  steering_scale=1.0,
@@ -563,6 +555,7 @@ class JoystickController(object):
         self.throttle_scale = throttle_scale
         self.steering_scale = steering_scale
         self.throttle_dir = throttle_dir
+        self._recompute_scale()
         self.recording = False
         self.recording_latch = None
         self.constant_throttle = False
@@ -574,11 +567,19 @@ class JoystickController(object):
         self.estop_state = self.ES_IDLE
         self.chaos_monkey_steering = None
         self.dead_zone = 0.0
+        self._thread = None
+
+        # bind the axis handlers once so every trigger map shares the same
+        # callable objects instead of creating new bound methods
+        self._set_steering = self.set_steering
+        self._set_throttle = self.set_throttle
+        self._do_nothing = self.do_nothing
 
         self.button_down_trigger_map = {}
         self.button_up_trigger_map = {}
         self.axis_trigger_map = {}
         self.init_trigger_maps()
+        self._rebuild_dispatch()
 
     def init_js(self):
         '''
@@ -594,6 +595,95 @@ class JoystickController(object):
         '''
         raise NotImplementedError("init_trigger_maps")
 
+    def _recompute_scale(self):
+        '''
+        cache the signed throttle scale; call whenever throttle_scale
+        or throttle_dir changes
+        '''
+        self._signed_scale = self.throttle_dir * self.throttle_scale
+
+    def _rebuild_dispatch(self):
+        '''
+        Specialize event dispatch for the current trigger maps, so the
+        polling loop makes a single call per event with the map lookups
+        already bound.  Called after init_trigger_maps() and whenever a
+        trigger is assigned.
+        '''
+        # with only a handful of bindings a linear scan over frozen
+        # (name, func) pairs is cheaper than hashing into a dict
+        self._axis_pairs = tuple(self.axis_trigger_map.items())
+        self._btn_down_pairs = tuple(self.button_down_trigger_map.items())
+        self._btn_up_pairs = tuple(self.button_up_trigger_map.items())
+        if max(len(self._axis_pairs), len(self._btn_down_pairs),
+               len(self._btn_up_pairs)) <= self.SMALL_TRIGGER_MAP_SIZE:
+            self._dispatch = self._pairs_dispatch()
+        else:
+            self._dispatch = self._map_dispatch()
+        self._bind_js_triggers()
+
+    def _bind_js_triggers(self):
+        '''
+        Resolve the trigger maps against the joystick's own axis and button
+        numbering, so a raw linux Joystick can invoke them by index
+        without translating events to names first.  Other devices keep
+        returning events to _dispatch.
+        '''
+        js = self.js
+        if isinstance(js, Joystick):
+            js.set_callbacks(
+                [self.axis_trigger_map.get(name) for name in js.axis_map],
+                [self.button_down_trigger_map.get(name)
+                 for name in js.button_map],
+                [self.button_up_trigger_map.get(name)
+                 for name in js.button_map])
+
+    def _pairs_dispatch(self):
+        axis_pairs = self._axis_pairs
+        btn_down_pairs = self._btn_down_pairs
+        btn_up_pairs = self._btn_up_pairs
+
+        def dispatch(button, button_state, axis, axis_val):
+            if axis is not None:
+                for name, func in axis_pairs:
+                    if name == axis:
+                        func(axis_val)
+                        break
+            if button:
+                if button_state >= 1:
+                    pairs = btn_down_pairs
+                elif button_state == 0:
+                    pairs = btn_up_pairs
+                else:
+                    return
+                for name, func in pairs:
+                    if name == button:
+                        func()
+                        break
+
+        return dispatch
+
+    def _map_dispatch(self):
+        axis_trigger = self.axis_trigger_map.get
+        button_down_trigger = self.button_down_trigger_map.get
+        button_up_trigger = self.button_up_trigger_map.get
+
+        def dispatch(button, button_state, axis, axis_val):
+            if axis is not None:
+                func = axis_trigger(axis)
+                if func is not None:
+                    func(axis_val)
+            if button:
+                if button_state >= 1:
+                    func = button_down_trigger(button)
+                elif button_state == 0:
+                    func = button_up_trigger(button)
+                else:
+                    func = None
+                if func is not None:
+                    func()
+
+        return dispatch
+
     def set_deadzone(self, val):
         '''
         sets the minimim throttle for recording
@@ -626,18 +716,21 @@ class JoystickController(object):
         assign a string button descriptor to a given function call
         '''
         self.button_down_trigger_map[button] = func
+        self._rebuild_dispatch()
 
     def set_button_up_trigger(self, button, func):
         '''
         assign a string button descriptor to a given function call
         '''
         self.button_up_trigger_map[button] = func
+        self._rebuild_dispatch()
 
     def set_axis_trigger(self, axis, func):
         '''
         assign a string axis descriptor to a given function call
         '''
         self.axis_trigger_map[axis] = func
+        self._rebuild_dispatch()
 
     def set_tub(self, tub):
         self.tub = tub
@@ -646,7 +739,7 @@ class JoystickController(object):
         if self.tub is not None:
             try:
                 self.tub.delete_last_n_records(self.num_records_to_erase)
-                logger.info('deleted last %d records.' %
+                logger.info('deleted last %d records.',
                             self.num_records_to_erase)
             except:
                 logger.info('failed to erase')
@@ -662,7 +755,8 @@ class JoystickController(object):
                 self.recording = recording
                 self.recording_latch = self.recording
                 logger.debug(
-                    f"JoystickController::on_throttle_changes() setting recording = {self.recording}")
+                    "JoystickController::on_throttle_changes() setting recording = %s",
+                    self.recording)
 
     def emergency_stop(self):
         '''
@@ -679,31 +773,17 @@ class JoystickController(object):
         '''
         poll a joystick for input events
         '''
+        # remember the polling thread so shutdown() can wait for it
+        self._thread = current_thread()
 
         # wait for joystick to be online
         while self.running and self.js is None and not self.init_js():
             time.sleep(3)
+        self._bind_js_triggers()
 
         while self.running:
-            button, button_state, axis, axis_val = self.js.poll()
-
-            if axis is not None and axis in self.axis_trigger_map:
-                '''
-                then invoke the function attached to that axis
-                '''
-                self.axis_trigger_map[axis](axis_val)
-
-            if button and button_state >= 1 and button in self.button_down_trigger_map:
-                '''
-                then invoke the function attached to that button
-                '''
-                self.button_down_trigger_map[button]()
-
-            if button and button_state == 0 and button in self.button_up_trigger_map:
-                '''
-                then invoke the function attached to that button
-                '''
-                self.button_up_trigger_map[button]()
+            # invoke the functions attached to the axis/button, if any
+            self._dispatch(*self.js.poll())
 
             time.sleep(self.poll_delay)
 
@@ -744,7 +824,7 @@ class JoystickController(object):
             tdead = self.dead_zone
         if abs(taxis) < tdead:
             taxis = 0.0
-        self.throttle = self.throttle_dir * taxis * self.throttle_scale
+        self.throttle = self._signed_scale * taxis
         # print("throttle", self.throttle)
         self.on_throttle_changes()
 
@@ -759,42 +839,44 @@ class JoystickController(object):
             self.recording = False
             self.recording_latch = self.recording
             logger.debug(
-                f"JoystickController::toggle_manual_recording() setting recording and recording_latch = {self.recording}")
+                "JoystickController::toggle_manual_recording() setting recording and recording_latch = %s",
+                self.recording)
         else:
             self.recording = True
             self.recording_latch = self.recording
             logger.debug(
-                f"JoystickController::toggle_manual_recording() setting recording and recording_latch = {self.recording}")
+                "JoystickController::toggle_manual_recording() setting recording and recording_latch = %s",
+                self.recording)
 
-        logger.info(f'recording: {self.recording}')
+        logger.info('recording: %s', self.recording)
 
     def increase_max_throttle(self):
         '''
         increase throttle scale setting
         '''
         self.throttle_scale = round(min(1.0, self.throttle_scale + 0.01), 2)
+        self._recompute_scale()
         if self.constant_throttle:
             self.throttle = self.throttle_scale
             self.on_throttle_changes()
         else:
-            self.throttle = (self.throttle_dir *
-                             self.last_throttle_axis_val * self.throttle_scale)
+            self.throttle = self._signed_scale * self.last_throttle_axis_val
 
-        logger.info(f'throttle_scale: {self.throttle_scale}')
+        logger.info('throttle_scale: %s', self.throttle_scale)
 
     def decrease_max_throttle(self):
         '''
         decrease throttle scale setting
         '''
         self.throttle_scale = round(max(0.0, self.throttle_scale - 0.01), 2)
+        self._recompute_scale()
         if self.constant_throttle:
             self.throttle = self.throttle_scale
             self.on_throttle_changes()
         else:
-            self.throttle = (self.throttle_dir *
-                             self.last_throttle_axis_val * self.throttle_scale)
+            self.throttle = self._signed_scale * self.last_throttle_axis_val
 
-        logger.info(f'throttle_scale: {self.throttle_scale}')
+        logger.info('throttle_scale: %s', self.throttle_scale)
 
     def toggle_constant_throttle(self):
         '''
@@ -808,7 +890,7 @@ class JoystickController(object):
             self.constant_throttle = True
             self.throttle = self.throttle_scale
             self.on_throttle_changes()
-        logger.info(f'constant_throttle: {self.constant_throttle}')
+        logger.info('constant_throttle: %s', self.constant_throttle)
 
     def toggle_mode(self):
         '''
@@ -824,7 +906,7 @@ class JoystickController(object):
         else:
             self.mode = 'user'
         self.mode_latch = self.mode
-        logger.info(f'new mode: {self.mode}')
+        logger.info('new mode: %s', self.mode)
 
     def chaos_monkey_on_left(self):
         self.chaos_monkey_steering = -0.2
@@ -853,11 +935,13 @@ class JoystickController(object):
             self.mode_latch = None
         if recording is not None and recording != self.recording:
             logger.debug(
-                f"JoystickController::run_threaded() setting recording from default = {recording}")
+                "JoystickController::run_threaded() setting recording from default = %s",
+                recording)
             self.recording = recording
         if self.recording_latch is not None:
             logger.debug(
-                f"JoystickController::run_threaded() setting recording from latch = {self.recording_latch}")
+                "JoystickController::run_threaded() setting recording from latch = %s",
+                self.recording_latch)
             self.recording = self.recording_latch
             self.recording_latch = None
 
@@ -887,13 +971,20 @@ class JoystickController(object):
 
         return self.angle, self.throttle, self.mode, self.recording
 
-    def run(self, img_arr=None, mode=None, recording=None):
-        return self.run_threaded(img_arr, mode, recording)
+    # non-threaded use does exactly the same work; alias it rather than
+    # paying for an extra call frame on every vehicle loop
+    run = run_threaded
 
     def shutdown(self):
-        # set flag to exit polling thread, then wait a sec for it to leave
+        # set flag to exit polling thread, then give it a moment to leave
         self.running = False
-        time.sleep(0.5)
+        if self._thread is not None and self._thread is not current_thread():
+            self._thread.join(timeout=0.5)
+            if self._thread.is_alive():
+                # still blocked reading the device; leave it open under it
+                return
+        if isinstance(self.js, Joystick):
+            self.js.shutdown()
 
 
 class JoystickCreatorController(JoystickController):
@@ -971,8 +1062,8 @@ class PS3JoystickController(JoystickController):
         }
 
         self.axis_trigger_map = {
-            'left_stick_horz': self.set_steering,
-            'right_stick_vert': self.set_throttle,
+            'left_stick_horz': self._set_steering,
+            'right_stick_vert': self._set_throttle,
         }
 
 
@@ -1001,8 +1092,8 @@ class PS3JoystickSixAdController(PS3JoystickController):
         super(PS3JoystickSixAdController, self).init_trigger_maps()
 
         self.axis_trigger_map = {
-            'right_stick_horz': self.set_steering,
-            'left_stick_vert': self.set_throttle,
+            'right_stick_horz': self._set_steering,
+            'left_stick_vert': self._set_throttle,
         }
 
 
@@ -1043,8 +1134,8 @@ class PS4JoystickController(JoystickController):
         }
 
         self.axis_trigger_map = {
-            'left_stick_horz': self.set_steering,
-            'right_stick_vert': self.set_throttle,
+            'left_stick_horz': self._set_steering,
+            'right_stick_vert': self._set_throttle,
         }
 
 
@@ -1099,13 +1190,10 @@ class XboxOneJoystickController(JoystickController):
             '''
             Maps raw axis values to magnitude.
             '''
-            # Axis values range from -1. to 1.
-            minimum = -1.
-            maximum = 1.
-            # Magnitude is now normalized in the range of 0 - 1.
-            magnitude = (axis_val - minimum) / (maximum - minimum)
+            # Axis values range from -1. to 1.; normalize to 0 - 1.
+            magnitude = (axis_val + 1.0) * 0.5
             if reverse:
-                magnitude *= -1
+                magnitude = -magnitude
             self.set_throttle(magnitude)
         return set_magnitude
 
@@ -1125,8 +1213,8 @@ class XboxOneJoystickController(JoystickController):
         }
 
         self.axis_trigger_map = {
-            'left_stick_horz': self.set_steering,
-            'right_stick_vert': self.set_throttle,
+            'left_stick_horz': self._set_steering,
+            'right_stick_vert': self._set_throttle,
             # Forza Mode
             'right_trigger': self.magnitude(),
             'left_trigger': self.magnitude(reverse=True),
@@ -1148,12 +1236,12 @@ class XboxOneSwappedJoystickController(XboxOneJoystickController):
         super(XboxOneSwappedJoystickController, self).init_trigger_maps()
 
         # make the actual swap of the sticks
-        self.set_axis_trigger('right_stick_horz', self.set_steering)
-        self.set_axis_trigger('left_stick_vert', self.set_throttle)
+        self.set_axis_trigger('right_stick_horz', self._set_steering)
+        self.set_axis_trigger('left_stick_vert', self._set_throttle)
 
         # unmap default assinments to the axes
-        self.set_axis_trigger('left_stick_horz', self.do_nothing)
-        self.set_axis_trigger('right_stick_vert', self.do_nothing)
+        self.set_axis_trigger('left_stick_horz', self._do_nothing)
+        self.set_axis_trigger('right_stick_vert', self._do_nothing)
 
 
 class LogitechJoystickController(JoystickController):
@@ -1199,23 +1287,25 @@ class LogitechJoystickController(JoystickController):
         }
 
         self.axis_trigger_map = {
-            'left_stick_horz': self.set_steering,
-            'right_stick_vert': self.set_throttle,
+            'left_stick_horz': self._set_steering,
+            'right_stick_vert': self._set_throttle,
             'dpad_leftright': self.on_axis_dpad_LR,
             'dpad_up_down': self.on_axis_dpad_UD,
         }
 
+        # dpad axis value -> action
+        self._dpad_lr = {-1.0: self.on_dpad_left, 1.0: self.on_dpad_right}
+        self._dpad_ud = {-1.0: self.on_dpad_up, 1.0: self.on_dpad_down}
+
     def on_axis_dpad_LR(self, val):
-        if val == -1.0:
-            self.on_dpad_left()
-        elif val == 1.0:
-            self.on_dpad_right()
+        func = self._dpad_lr.get(val)
+        if func is not None:
+            func()
 
     def on_axis_dpad_UD(self, val):
-        if val == -1.0:
-            self.on_dpad_up()
-        elif val == 1.0:
-            self.on_dpad_down()
+        func = self._dpad_ud.get(val)
+        if func is not None:
+            func()
 
     def on_dpad_up(self):
         self.increase_max_throttle()
@@ -1255,8 +1345,8 @@ class NimbusController(JoystickController):
         }
 
         self.axis_trigger_map = {
-            'lx': self.set_steering,
-            'ry': self.set_throttle,
+            'lx': self._set_steering,
+            'ry': self._set_throttle,
         }
 
 
@@ -1285,8 +1375,8 @@ class WiiUController(JoystickController):
         }
 
         self.axis_trigger_map = {
-            'LEFT_STICK_X': self.set_steering,
-            'RIGHT_STICK_Y': self.set_throttle,
+            'LEFT_STICK_X': self._set_steering,
+            'RIGHT_STICK_Y': self._set_throttle,
         }
 
 
@@ -1338,33 +1428,58 @@ class RC3ChanJoystickController(JoystickController):
         }
 
 
+# JoyStickPub/JoyStickSub wire format: a fixed header of button state,
+# axis value and the lengths of the two names, followed by the utf-8
+# button and axis names (empty when the message carries no such event)
+_JS_WIRE_HEADER = struct.Struct('<hfBB')
+
+
+def pack_js_message(button, button_state, axis, axis_val):
+    button_name = button.encode('utf-8') if button is not None else b''
+    axis_name = axis.encode('utf-8') if axis is not None else b''
+    header = _JS_WIRE_HEADER.pack(
+        button_state if button is not None else 0,
+        axis_val if axis is not None else 0.0,
+        len(button_name), len(axis_name))
+    return header + button_name + axis_name
+
+
+def unpack_js_message(payload):
+    button_state, axis_val, button_len, axis_len = \
+        _JS_WIRE_HEADER.unpack_from(payload)
+    # names are interned so that trigger map lookups on them, which use
+    # interned literal keys, succeed on the identity check
+    start = _JS_WIRE_HEADER.size
+    button = sys.intern(payload[start:start + button_len].decode('utf-8')) \
+        if button_len else None
+    start += button_len
+    axis = sys.intern(payload[start:start + axis_len].decode('utf-8')) \
+        if axis_len else None
+    return button, button_state, axis, axis_val
+
+
 class JoyStickPub(object):
     '''
     Use Zero Message Queue (zmq) to publish the control messages from a local joystick
     '''
 
     def __init__(self, port=5556, dev_fn='/dev/input/js1'):
-        import zmq
+        if zmq is None:
+            raise ModuleNotFoundError("JoyStickPub requires pyzmq")
         self.dev_fn = dev_fn
         self.js = PS3JoystickPC(self.dev_fn)
         self.js.init()
-        context = zmq.Context()
+        context = zmq.Context.instance()
         self.socket = context.socket(zmq.PUB)
         self.socket.bind("tcp://*:%d" % port)
 
     def run(self):
         while True:
-            button, button_state, axis, axis_val = self.js.poll()
+            message_data = self.js.poll()
+            button, button_state, axis, axis_val = message_data
             if axis is not None or button is not None:
-                if button is None:
-                    button = "0"
-                    button_state = 0
-                if axis is None:
-                    axis = "0"
-                    axis_val = 0
-                message_data = (button, button_state, axis, axis_val)
-                self.socket.send_string("%s %d %s %f" % message_data)
-                logger.info(f"SENT {message_data}")
+                self.socket.send(pack_js_message(*message_data), copy=False)
+                logger.info("SENT %s", message_data)
 
 
 class JoyStickSub(object):
@@ -1372,14 +1487,28 @@ class JoyStickSub(object):
     Use Zero Message Queue (zmq) to subscribe to control messages from a remote joystick
     '''
 
-    def __init__(self, ip, port=5556):
-        import zmq
-        context = zmq.Context()
+    def __init__(self, ip, port=5556, poll_timeout_ms=100, conflate=False):
+        '''
+        :param conflate: keep only the newest unread message (ZMQ_CONFLATE)
+                         so a stalled subscriber never works through stale
+                         stick positions.  Off by default because it also
+                         discards button events that are still queued.
+        '''
+        if zmq is None:
+            raise ModuleNotFoundError("JoyStickSub requires pyzmq")
+        context = zmq.Context.instance()
         self.socket = context.socket(zmq.SUB)
+        if conflate:
+            # must be set before connecting
+            self.socket.setsockopt(zmq.CONFLATE, 1)
         self.socket.connect("tcp://%s:%d" % (ip, port))
         self.socket.setsockopt_string(zmq.SUBSCRIBE, '')
-        self.button = None
-        self.button_state = 0
+        self._poller = zmq.Poller()
+        self._poller.register(self.socket, zmq.POLLIN)
+        self.poll_timeout_ms = poll_timeout_ms
+        # every button event is kept until poll() hands it out, while
+        # only the latest axis value matters
+        self._buttons = deque()
         self.axis = None
         self.axis_val = 0.0
         self.running = True
@@ -1390,51 +1519,53 @@ class JoyStickSub(object):
 
     def update(self):
         while self.running:
-            payload = self.socket.recv().decode("utf-8")
-            # print("got", payload)
-            button, button_state, axis, axis_val = payload.split(' ')
-            self.button = button
-            self.button_state = (int)(button_state)
-            self.axis = axis
-            self.axis_val = (float)(axis_val)
-            if self.button == "0":
-                self.button = None
-            if self.axis == "0":
-                self.axis = None
+            # sleep until messages arrive, then take all that are queued
+            if not self._poller.poll(self.poll_timeout_ms):
+                continue
+            while True:
+                try:
+                    payload = self.socket.recv(zmq.NOBLOCK)
+                except zmq.Again:
+                    break
+                button, button_state, axis, axis_val = \
+                    unpack_js_message(payload)
+                if button is not None:
+                    self._buttons.append((button, button_state))
+                if axis is not None:
+                    self.axis_val = axis_val
+                    self.axis = axis
 
     def run_threaded(self):
         pass
 
     def poll(self):
-        ret = (self.button, self.button_state, self.axis, self.axis_val)
-        self.button = None
+        if self._buttons:
+            button, button_state = self._buttons.popleft()
+        else:
+            button, button_state = None, 0
+        ret = (button, button_state, self.axis, self.axis_val)
         self.axis = None
         return ret
 
 
+# cfg.CONTROLLER_TYPE -> joystick controller class
+JS_CONTROLLER_CLASSES = {
+    "ps3": PS3JoystickController,
+    "ps3sixad": PS3JoystickSixAdController,
+    "ps4": PS4JoystickController,
+    "nimbus": NimbusController,
+    "xbox": XboxOneJoystickController,
+    "xboxswapped": XboxOneSwappedJoystickController,
+    "wiiu": WiiUController,
+    "F710": LogitechJoystickController,
+    "rc3": RC3ChanJoystickController,
+    "pygame": PyGamePS4JoystickController,
+}
+
+
 def get_js_controller(cfg):
-    cont_class = None
-    if cfg.CONTROLLER_TYPE == "ps3":
-        cont_class = PS3JoystickController
-    elif cfg.CONTROLLER_TYPE == "ps3sixad":
-        cont_class = PS3JoystickSixAdController
-    elif cfg.CONTROLLER_TYPE == "ps4":
-        cont_class = PS4JoystickController
-    elif cfg.CONTROLLER_TYPE == "nimbus":
-        cont_class = NimbusController
-    elif cfg.CONTROLLER_TYPE == "xbox":
-        cont_class = XboxOneJoystickController
-    elif cfg.CONTROLLER_TYPE == "xboxswapped":
-        cont_class = XboxOneSwappedJoystickController
-    elif cfg.CONTROLLER_TYPE == "wiiu":
-        cont_class = WiiUController
-    elif cfg.CONTROLLER_TYPE == "F710":
-        cont_class = LogitechJoystickController
-    elif cfg.CONTROLLER_TYPE == "rc3":
-        cont_class = RC3ChanJoystickController
-    elif cfg.CONTROLLER_TYPE == "pygame":
-        cont_class = PyGamePS4JoystickController
-    else:
+    cont_class = JS_CONTROLLER_CLASSES.get(cfg.CONTROLLER_TYPE)
+    if cont_class is None:
         raise ValueError("Unknown controller type: " + cfg.CONTROLLER_TYPE)
 
     ctr = cont_class(throttle_dir=cfg.JOYSTICK_THROTTLE_DIR,
@@ -1461,7 +1592,7 @@ if __name__ == "__main__":
     js.init()
 
     while True:
+        # poll() blocks until an event arrives or its timeout passes
         button, button_state, axis, axis_val = js.poll()
         if button is not None or axis is not None:
             print(button, button_state, axis, axis_val)
-        time.sleep(0.1)
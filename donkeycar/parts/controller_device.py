@@ -7,10 +7,16 @@ smaller, more focused modules.
 
 from __future__ import annotations
 
+import io
 import os
+import sys
 import array
 import struct
 import logging
+import selectors
+from collections import deque
+
+import numpy as np
 
 # Try to import ioctl for joystick support
 try:
@@ -26,6 +32,29 @@ except ModuleNotFoundError:
 
 logger = logging.getLogger(__name__)
 
+# layout of a linux js_event struct: time, value, type, number
+_JSEV = struct.Struct('IhBB')
+# size of a js_event and how many are read per system call; one read of
+# a default sized buffer drains everything the driver can have queued
+JS_EVENT_SIZE = _JSEV.size
+JS_EVENTS_PER_READ = io.DEFAULT_BUFFER_SIZE // JS_EVENT_SIZE
+# converts a raw js axis value to the -1.0..1.0 range
+_AXIS_SCALE = 1.0 / 32767.0
+
+# joystick ioctl requests, see linux/joystick.h
+_JSIOCGAXES = 0x80016a11
+_JSIOCGBUTTONS = 0x80016a12
+_JSIOCGAXMAP = 0x80406a32
+_JSIOCGBTNMAP = 0x80406a34
+
+
+def _JSIOCGNAME(length):
+    return 0x80006a13 + (0x10000 * length)
+
+
+# init() reads the name into a 64 byte buffer, so its request is fixed
+_JSIOCGNAME64 = _JSIOCGNAME(0x40)
+
 
 # Provide a lightweight pigpio fallback when the real module isn't available,
 # so RCReceiver can be imported on non-Raspberry Pi systems for testing.
@@ -54,34 +83,83 @@ except ImportError:
             return _FakePi()
 
         @staticmethod
-        def tick_diff(high, tick):
-            if high is None or tick is None:
-                return 0
-            try:
-                return tick - high
-            except (TypeError, ValueError):
-                return 0
+        def tickDiff(t1, t2):
+            # ticks are unsigned 32 bit microseconds that wrap
+            return (t2 - t1) & 0xFFFFFFFF
 
     pigpio = _FakePigpioModule()
 
 
+# one pigpio daemon connection shared by every RCReceiver in the process
+_pi = None
+
+
+def _get_pi():
+    global _pi
+    if _pi is None:
+        _pi = pigpio.pi()
+    return _pi
+
+
+def joystick_profile(axis_names: dict, button_names: dict):
+    '''
+    Class decorator that attaches the axis and button name mappings of a
+    specific joystick to a Joystick (or PyGameJoystick) subclass, so the
+    subclass does not need to override __init__ just to assign them.
+    '''
+    def decorate(cls):
+        cls.AXIS_NAMES = axis_names
+        cls.BUTTON_NAMES = button_names
+        return cls
+    return decorate
+
+
 class Joystick:
     '''
     An interface to a physical joystick.
     '''
 
-    def __init__(self, dev_fn: str = '/dev/input/js0') -> None:
-        self.axis_states = {}
-        self.button_states = {}
-        self.axis_names = {}
-        self.button_names = {}
-        self.axis_map = []
-        self.button_map = []
+    # code -> name mappings, usually set per device via @joystick_profile
+    AXIS_NAMES: dict = {}
+    BUTTON_NAMES: dict = {}
+
+    def __init__(self, dev_fn: str = '/dev/input/js0',
+                 poll_timeout: float = 0.1) -> None:
+        # per-instance copies; JoystickCreator edits these while mapping
+        self.axis_names = dict(self.AXIS_NAMES)
+        self.button_names = dict(self.BUTTON_NAMES)
+        # driver axis/button number -> name, fixed once init() has run
+        self.axis_map = ()
+        self.button_map = ()
+        # latest value of every axis and button by driver number; numbers
+        # are a byte wide. Exposed by name through axis_states and
+        # button_states
+        self._axis_vals = array.array('d', bytes(8 * 256))
+        self._button_vals = array.array('h', bytes(2 * 256))
         self.jsdev = None
         self.dev_fn = dev_fn
         self.num_axes = 0
         self.num_buttons = 0
         self.js_name = ''
+        # decoded events waiting to be returned by poll()
+        self._pending = deque()
+        # poll() sleeps in the selector until the device is readable or
+        # this many seconds have passed, so callers need not throttle it
+        self.poll_timeout = poll_timeout
+        self._selector = selectors.DefaultSelector()
+        # optional callbacks indexed by the driver's axis/button number,
+        # see set_callbacks()
+        self._axis_callbacks = None
+        self._button_down_callbacks = None
+        self._button_up_callbacks = None
+        # analog filtering: values inside axis_deadzone read as 0.0 and
+        # moves smaller than axis_min_delta from the last reported value
+        # are swallowed, except when reaching center or full deflection.
+        # The controllers apply their own configured dead zone, so none is
+        # applied here by default.
+        self.axis_deadzone = 0.0
+        self.axis_min_delta = 1.0 / 128
+        self._axis_last = [0.0] * 256
 
     def init(self) -> bool:
         if ioctl is None:
@@ -89,85 +167,221 @@ class Joystick:
                 "no support for fnctl module. joystick not enabled.")
             return False
 
-        if not os.path.exists(self.dev_fn):
+        logger.info("Opening %s...", self.dev_fn)
+        # raw, non-blocking file descriptor; avoids the buffering of Python
+        # file objects and poll() waits for input in the selector instead
+        try:
+            self.jsdev = os.open(self.dev_fn, os.O_RDONLY | os.O_NONBLOCK)
+        except FileNotFoundError:
             logger.warning("%s is missing", self.dev_fn)
             return False
+        self._selector.register(self.jsdev, selectors.EVENT_READ)
 
-        logger.info("Opening %s...", self.dev_fn)
-        self.jsdev = open(self.dev_fn, 'rb')
-
-        buf = array.array('B', [0] * 64)
-        ioctl(self.jsdev, 0x80006a13 + (0x10000 * len(buf)), buf)
-        self.js_name = buf.tobytes().decode('utf-8')
+        # one byte buffer serves the name, count and axis map requests
+        buf = bytearray(0x40)
+        ioctl(self.jsdev, _JSIOCGNAME64, buf)
+        self.js_name = buf.split(b'\0', 1)[0].decode('utf-8')
         logger.info("Device name: %s", self.js_name)
 
-        buf = array.array('B', [0])
-        ioctl(self.jsdev, 0x80016a11, buf)  # JSIOCGAXES
+        ioctl(self.jsdev, _JSIOCGAXES, buf)
         self.num_axes = buf[0]
 
-        buf = array.array('B', [0])
-        ioctl(self.jsdev, 0x80016a12, buf)  # JSIOCGBUTTONS
+        ioctl(self.jsdev, _JSIOCGBUTTONS, buf)
         self.num_buttons = buf[0]
 
-        buf = array.array('B', [0] * 0x40)
-        ioctl(self.jsdev, 0x80406a32, buf)  # JSIOCGAXMAP
+        ioctl(self.jsdev, _JSIOCGAXMAP, buf)
 
-        for axis in buf[: self.num_axes]:
-            axis_name = self.axis_names.get(axis, 'unknown(0x%02x)' % axis)
-            self.axis_map.append(axis_name)
-            self.axis_states[axis_name] = 0.0
+        # memoryview slices walk the maps without copying them
+        # names are interned, so lookups in trigger maps compare by identity
+        self.axis_map = tuple(
+            sys.intern(self.axis_names.get(axis, 'unknown(0x%02x)' % axis))
+            for axis in memoryview(buf)[: self.num_axes])
 
-        buf = array.array('H', [0] * 200)
-        ioctl(self.jsdev, 0x80406a34, buf)  # JSIOCGBTNMAP
+        buf = array.array('H', bytes(400))
+        ioctl(self.jsdev, _JSIOCGBTNMAP, buf)
 
-        for btn in buf[: self.num_buttons]:
-            btn_name = self.button_names.get(btn, 'unknown(0x%03x)' % btn)
-            self.button_map.append(btn_name)
-            self.button_states[btn_name] = 0
+        self.button_map = tuple(
+            sys.intern(self.button_names.get(btn, 'unknown(0x%03x)' % btn))
+            for btn in memoryview(buf)[: self.num_buttons])
 
         return True
 
+    @property
+    def axis_states(self) -> dict:
+        '''
+        Latest value of each axis by name.
+        '''
+        return dict(zip(self.axis_map, self._axis_vals))
+
+    @property
+    def button_states(self) -> dict:
+        '''
+        Latest state of each button by name.
+        '''
+        return dict(zip(self.button_map, self._button_vals))
+
+    def set_callbacks(self, axis_callbacks, button_down_callbacks,
+                      button_up_callbacks) -> None:
+        '''
+        Have poll() invoke callbacks directly instead of returning events.
+        Each argument is a list indexed by the driver's axis or button
+        number (the same indexing as axis_map/button_map) holding a
+        function or None, so an event is dispatched with one list index
+        rather than a name lookup.  Axis callbacks receive the axis value.
+        '''
+        self._axis_callbacks = axis_callbacks
+        self._button_down_callbacks = button_down_callbacks
+        self._button_up_callbacks = button_up_callbacks
+
+    def fileno(self) -> int:
+        return self.jsdev
+
+    def shutdown(self) -> None:
+        if self.jsdev is not None:
+            try:
+                self._selector.unregister(self.jsdev)
+            except KeyError:
+                pass
+            os.close(self.jsdev)
+            self.jsdev = None
+
     def show_map(self) -> None:
         print('%d axes found: %s' % (self.num_axes, ', '.join(self.axis_map)))
         print('%d buttons found: %s' %
               (self.num_buttons, ', '.join(self.button_map)))
 
-    def poll(self):
-        button = None
-        button_state = None
-        axis = None
-        axis_val = None
-
-        if self.jsdev is None:
-            return button, button_state, axis, axis_val
-
-        evbuf = self.jsdev.read(8)
-
-        if evbuf:
-            _tval, value, typev, number = struct.unpack('IhBB', evbuf)
-
+    def _drain(self) -> None:
+        '''
+        Read every event the driver has queued (up to JS_EVENTS_PER_READ)
+        in one system call; returns without events if there are none.
+        Repeated moves of the same axis are collapsed to the latest
+        value so a backlog of analog samples is not replayed one by one;
+        button events are all kept so no press is lost.  Events are either
+        queued for poll() or, once set_callbacks() was called, dispatched.
+        '''
+        try:
+            evbuf = os.read(self.jsdev, JS_EVENT_SIZE * JS_EVENTS_PER_READ)
+        except BlockingIOError:
+            return
+        # the driver only hands out whole events; guard against a partial
+        # one without copying the buffer in the common case
+        partial = len(evbuf) % JS_EVENT_SIZE
+        if partial:
+            evbuf = memoryview(evbuf)[:-partial]
+        # bind everything the loop touches to locals; this is the per-event
+        # hot path and attribute lookups dominate its cost
+        button_map = self.button_map
+        axis_map = self.axis_map
+        button_vals = self._button_vals
+        axis_vals = self._axis_vals
+        axis_last = self._axis_last
+        axis_deadzone = self.axis_deadzone
+        axis_min_delta = self.axis_min_delta
+        axis_callbacks = self._axis_callbacks
+        button_down_callbacks = self._button_down_callbacks
+        button_up_callbacks = self._button_up_callbacks
+        direct = axis_callbacks is not None
+        pending = self._pending
+        # checked once per batch, so per-event logging costs nothing when
+        # the level is disabled but runtime level changes are still seen
+        log_info = logger.isEnabledFor(logging.INFO)
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        pending_axes = {}
+        for _tval, value, typev, number in _JSEV.iter_unpack(evbuf):
             if typev & 0x80:
-                return button, button_state, axis, axis_val
+                continue
 
             if typev & 0x01:
-                button = self.button_map[number]
+                button = button_map[number]
                 if button:
-                    self.button_states[button] = value
-                    button_state = value
-                    logger.info("button: %s state: %d", button, value)
-
-            if typev & 0x02:
-                axis = self.axis_map[number]
+                    button_vals[number] = value
+                    if log_info:
+                        logger.info("button: %s state: %d", button, value)
+                    if direct:
+                        if value >= 1:
+                            func = button_down_callbacks[number]
+                        else:
+                            func = button_up_callbacks[number]
+                        if func is not None:
+                            func()
+                    else:
+                        pending.append((button, value, None, None))
+
+            elif typev & 0x02:
+                axis = axis_map[number]
                 if axis:
-                    fvalue = value / 32767.0
-                    self.axis_states[axis] = fvalue
-                    axis_val = fvalue
-                    logger.debug("axis: %s val: %f", axis, fvalue)
+                    fvalue = value * _AXIS_SCALE
+                    if axis_deadzone and abs(fvalue) < axis_deadzone:
+                        fvalue = 0.0
+                    axis_vals[number] = fvalue
+                    delta = abs(fvalue - axis_last[number])
+                    if delta == 0.0 or (delta < axis_min_delta and
+                                        0.0 < abs(fvalue) < 1.0):
+                        continue
+                    axis_last[number] = fvalue
+                    if log_debug:
+                        logger.debug("axis: %s val: %f", axis, fvalue)
+                    if direct:
+                        pending_axes[number] = fvalue
+                        continue
+                    event = (None, None, axis, fvalue)
+                    index = pending_axes.get(number)
+                    if index is None:
+                        pending_axes[number] = len(pending)
+                        pending.append(event)
+                    else:
+                        pending[index] = event
+
+        if direct:
+            for number, fvalue in pending_axes.items():
+                func = axis_callbacks[number]
+                if func is not None:
+                    func(fvalue)
+
+    def poll(self, timeout: float | None = None):
+        '''
+        Return the next joystick event as a tuple of
+        (button, button_state, axis, axis_val); the fields that do not
+        apply to the event are None.  Waits up to timeout seconds
+        (poll_timeout when not given, 0 to not wait) for the device to
+        become readable and returns all None if it does not.
+        '''
+        if self.jsdev is None:
+            return None, None, None, None
+
+        if timeout is None:
+            timeout = self.poll_timeout
+        if not self._pending and self._selector.select(timeout):
+            self._drain()
+        if self._pending:
+            return self._pending.popleft()
+        return None, None, None, None
+
+    def poll_events(self, timeout: float | None = None) -> list:
+        '''
+        Return all pending joystick events as a list of
+        (button, button_state, axis, axis_val) tuples, draining whatever
+        the driver has queued in one read.  Waits for input like poll()
+        and returns an empty list without.
+        '''
+        if self.jsdev is None:
+            return []
 
-        return button, button_state, axis, axis_val
+        if timeout is None:
+            timeout = self.poll_timeout
+        if not self._pending and self._selector.select(timeout):
+            self._drain()
+        events = list(self._pending)
+        self._pending.clear()
+        return events
 
 
 class PyGameJoystick:
+    # index -> name mappings, usually set per device via @joystick_profile;
+    # when empty the raw pygame indexes are used as names
+    AXIS_NAMES: dict = {}
+    BUTTON_NAMES: dict = {}
+
     def __init__(
         self,
         poll_delay=0.0,
@@ -206,6 +420,8 @@ class PyGameJoystick:
         _dev_fn = dev_fn
         _auto_record_on_throttle = auto_record_on_throttle
 
+        # pygame.event.get bound once; poll() pumps events on every call
+        self._pygame_event_get = None
         if pygame is None:
             logger.warning('pygame not available; PyGameJoystick disabled')
             self.joystick = None
@@ -218,78 +434,130 @@ class PyGameJoystick:
                 self.joystick.init()
                 name = self.joystick.get_name()
                 logger.info("detected joystick device: %s", name)
+                self._pygame_event_get = pygame.event.get
             except (ModuleNotFoundError, ImportError, RuntimeError, AttributeError) as e:
                 logger.exception(
                     'pygame joystick initialization failed: %s', e)
                 self.joystick = None
 
+        # the control counts never change for an opened joystick, so query
+        # them once rather than on every poll
         if self.joystick is not None:
-            self.axis_states = [0.0 for _ in range(
-                self.joystick.get_numaxes())]
-            self.button_states = [
-                0 for _ in range(self.joystick.get_numbuttons() + self.joystick.get_numhats() * 4)
-            ]
+            self._num_axes = self.joystick.get_numaxes()
+            self._num_buttons = self.joystick.get_numbuttons()
+            self._num_hats = self.joystick.get_numhats()
         else:
-            self.axis_states = []
-            self.button_states = []
+            self._num_axes = self._num_buttons = self._num_hats = 0
+        num_hat_buttons = self._num_buttons + self._num_hats * 4
+        self.axis_states = [0.0] * self._num_axes
+        self.button_states = [0] * num_hat_buttons
 
-        self.axis_names = {}
-        self.button_names = {}
+        self.axis_names = dict(self.AXIS_NAMES)
+        self.button_names = dict(self.BUTTON_NAMES)
         self.dead_zone = 0.07
-        for i in range(self.joystick.get_numaxes() if self.joystick else 0):
-            self.axis_names[i] = i
-        for i in range(self.joystick.get_numbuttons() + self.joystick.get_numhats() * 4 if self.joystick else 0):
-            self.button_names[i] = i
+        if not self.axis_names:
+            for i in range(self._num_axes):
+                self.axis_names[i] = i
+        if not self.button_names:
+            for i in range(num_hat_buttons):
+                self.button_names[i] = i
+        # index -> name lists (None when unnamed) used by the poll loops
+        self._axis_name_arr = [self.axis_names.get(i)
+                               for i in range(self._num_axes)]
+        self._button_name_arr = [self.button_names.get(i)
+                                 for i in range(num_hat_buttons)]
+        # numpy copies of the axis and button states, so each poll finds
+        # the changed controls with one vectorized compare; only named axes
+        # are tracked, unnamed ones never report a change
+        self._axis_named = np.array(
+            [name is not None for name in self._axis_name_arr], dtype=bool)
+        self._axis_vals = np.zeros(self._num_axes)
+        # scratch buffers for the dead zone mask, reused on every poll
+        self._axis_abs = np.zeros(self._num_axes)
+        self._axis_live = np.zeros(self._num_axes, dtype=bool)
+        self._button_vals = np.zeros(self._num_buttons, dtype=np.int8)
+        # last direction bits of each hat, see _poll_hats()
+        self._hat_bits = [0] * self._num_hats
 
     def _poll_axes(self):
         """Poll joystick axes and return axis info if changed."""
-        axis = None
-        axis_val = None
-        for i in range(self.joystick.get_numaxes()):
-            val = self.joystick.get_axis(i)
-            if abs(val) < self.dead_zone:
-                val = 0.0
-            if self.axis_states[i] != val and i in self.axis_names:
-                axis = self.axis_names[i]
-                axis_val = val
-                self.axis_states[i] = val
-                logger.debug("axis: %s val: %f", axis, val)
-        return axis, axis_val
+        num_axes = self._num_axes
+        vals = np.fromiter(map(self.joystick.get_axis, range(num_axes)),
+                           dtype=np.float64, count=num_axes)
+        # zero the axes inside the dead zone by multiplying with the mask
+        # rather than branching per axis; adding 0.0 turns -0.0 into 0.0
+        live = self._axis_live
+        np.greater_equal(np.abs(vals, out=self._axis_abs), self.dead_zone,
+                         out=live)
+        np.multiply(vals, live, out=vals)
+        np.add(vals, 0.0, out=vals)
+        changed = np.flatnonzero((vals != self._axis_vals) & self._axis_named)
+        if not changed.size:
+            return None, None
+        self._axis_vals[changed] = vals[changed]
+        axis_states = self.axis_states
+        axis_name_arr = self._axis_name_arr
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        for i in changed.tolist():
+            val = float(vals[i])
+            axis_states[i] = val
+            if log_debug:
+                logger.debug("axis: %s val: %f", axis_name_arr[i], val)
+        # like the per-axis loop before, the highest changed axis is reported
+        return axis_name_arr[i], val
 
     def _poll_buttons(self):
         """Poll joystick buttons and return button info if changed."""
         button = None
         button_state = None
-        for i in range(self.joystick.get_numbuttons()):
-            state = self.joystick.get_button(i)
-            if self.button_states[i] != state:
-                if i not in self.button_names:
-                    logger.info("button: %d", i)
-                    continue
-                button = self.button_names[i]
-                button_state = state
-                self.button_states[i] = state
-                logger.info("button: %s state: %d", button, state)
+        num_buttons = self._num_buttons
+        states = np.fromiter(map(self.joystick.get_button, range(num_buttons)),
+                             dtype=np.int8, count=num_buttons)
+        changed = np.flatnonzero(states != self._button_vals)
+        button_name_arr = self._button_name_arr
+        button_vals = self._button_vals
+        button_states = self.button_states
+        for i in changed.tolist():
+            name = button_name_arr[i]
+            if name is None:
+                logger.info("button: %d", i)
+                continue
+            button = name
+            button_state = int(states[i])
+            button_vals[i] = button_state
+            button_states[i] = button_state
+            logger.info("button: %s state: %d", button, button_state)
         return button, button_state
 
     def _poll_hats(self):
         """Poll joystick hats and return button info if changed."""
         button = None
         button_state = None
-        for i in range(self.joystick.get_numhats()):
-            hat = self.joystick.get_hat(i)
-            horz, vert = hat
-            i_btn = self.joystick.get_numbuttons() + (i * 4)
-            states = (horz == -1, horz == 1, vert == -1, vert == 1)
-            for state in states:
-                state = int(state)
-                if self.button_states[i_btn] != state:
-                    if i_btn not in self.button_names:
-                        logger.info("button: %d", i_btn)
-                        continue
-                    button = self.button_names[i_btn]
-                    button_state = state
-                    self.button_states[i_btn] = state
+        get_hat = self.joystick.get_hat
+        hat_bits = self._hat_bits
+        num_buttons = self._num_buttons
+        for i in range(self._num_hats):
+            horz, vert = get_hat(i)
+            # the four hat directions packed as bits: left, right, down, up
+            bits = ((horz == -1) | ((horz == 1) << 1) |
+                    ((vert == -1) << 2) | ((vert == 1) << 3))
+            changed = bits ^ hat_bits[i]
+            if not changed:
+                continue
+            hat_bits[i] = bits
+            # visit only the directions that changed, lowest bit first
+            while changed:
+                bit = changed & -changed
+                changed ^= bit
+                k = bit.bit_length() - 1
+                i_btn = num_buttons + (i * 4) + k
+                name = self._button_name_arr[i_btn]
+                if name is None:
+                    logger.info("button: %d", i_btn)
+                    continue
+                button = name
+                button_state = (bits >> k) & 1
+                self.button_states[i_btn] = button_state
         return button, button_state
 
     def poll(self):
@@ -298,10 +566,10 @@ class PyGameJoystick:
         axis = None
         axis_val = None
 
-        if pygame is None or self.joystick is None:
+        if self.joystick is None:
             return button, button_state, axis, axis_val
 
-        pygame.event.get()
+        self._pygame_event_get()
 
         axis, axis_val = self._poll_axes()
         button, button_state = self._poll_buttons()
@@ -326,6 +594,10 @@ class PyGameJoystick:
 
 # Simple device helpers
 class Channel:
+    # fixed slots: tick and high_tick are stored from the pigpio callback
+    # thread on every edge
+    __slots__ = ('pin', 'tick', 'high_tick')
+
     def __init__(self, pin):
         self.pin = pin
         self.tick = None
@@ -337,12 +609,16 @@ class RCReceiver:
     MAX_OUT = 1
 
     def __init__(self, cfg, debug=False):
-        self.pi = pigpio.pi()
+        self.pi = _get_pi()
         self.channels = [
             Channel(cfg.STEERING_RC_GPIO),
             Channel(cfg.THROTTLE_RC_GPIO),
             Channel(cfg.DATA_WIPER_RC_GPIO),
         ]
+        # gpio pin -> channel, so each edge callback is a single lookup;
+        # the bound get saves cbf an attribute lookup on every edge
+        self._pin_to_channel = {channel.pin: channel for channel in self.channels}
+        self._channel_for_pin = self._pin_to_channel.get
         self.min_pwm = 1000
         self.max_pwm = 2000
         self.oldtime = 0
@@ -352,14 +628,28 @@ class RCReceiver:
         self.MAX_REVERSE = cfg.PIGPIO_MAX_REVERSE
         self.RECORD = cfg.AUTO_RECORD_ON_THROTTLE
         self.debug = debug
+        # run() logs every frame when debugging; decide once whether those
+        # messages can be emitted at all
+        self._debug_enabled = bool(debug) and logger.isEnabledFor(logging.INFO)
         self.mode = 'user'
         self.is_action = False
         self.invert = cfg.PIGPIO_INVERT
         self.jitter = cfg.PIGPIO_JITTER
         self.factor = (self.MAX_OUT - self.MIN_OUT) / \
             (self.max_pwm - self.min_pwm)
+        # the pulse width -> signal mapping, including the inversion, as a
+        # single affine transform: signal = tick * _scale + _offset
+        if self.invert:
+            self._scale = -self.factor
+            self._offset = self.MAX_OUT + self.factor * self.min_pwm
+        else:
+            self._scale = self.factor
+            self._offset = self.MIN_OUT - self.factor * self.min_pwm
         self.cbs = []
         self.signals = [0, 0, 0]
+        # preallocated work arrays for the per-channel signal math in run()
+        self._ticks = np.zeros(len(self.channels))
+        self._signals = np.zeros(len(self.channels))
         for channel in self.channels:
             self.pi.set_mode(channel.pin, pigpio.INPUT)
             self.cbs.append(self.pi.callback(
@@ -368,14 +658,17 @@ class RCReceiver:
                 logger.info("RCReceiver gpio %d created", channel.pin)
 
     def cbf(self, gpio, level, tick):
-        for channel in self.channels:
-            if gpio == channel.pin:
-                if level == 1:
-                    channel.high_tick = tick
-                elif level == 0:
-                    if channel.high_tick is not None:
-                        channel.tick = pigpio.tick_diff(
-                            channel.high_tick, tick)
+        channel = self._channel_for_pin(gpio)
+        if channel is None:
+            return
+        if level == 1:
+            channel.high_tick = tick
+        elif level == 0:
+            # level 2 is a pigpio watchdog timeout and carries no edge
+            high_tick = channel.high_tick
+            if high_tick is not None:
+                # same as pigpio.tickDiff: ticks are unsigned 32 bit and wrap
+                channel.tick = (tick - high_tick) & 0xFFFFFFFF
 
     def pulse_width(self, high):
         if high is not None:
@@ -383,22 +676,21 @@ class RCReceiver:
         return 0.0
 
     def run(self, mode=None, recording=None):
-        i = 0
-        for channel in self.channels:
-            self.signals[i] = (self.pulse_width(
-                channel.tick) - self.min_pwm) * self.factor
-            if self.invert:
-                self.signals[i] = -self.signals[i] + self.MAX_OUT
-            else:
-                self.signals[i] += self.MIN_OUT
-            i += 1
-        if self.debug:
+        ticks = self._ticks
+        # snapshot every channel's last pulse width in one pass. cbf
+        # publishes each width with a single attribute store, which is
+        # atomic under the GIL, so a read never sees a half-written value;
+        # a channel with no pulse yet (None) reads as 0.0 like pulse_width()
+        ticks[:] = [channel.tick or 0.0 for channel in self.channels]
+        signals = self._signals
+        np.multiply(ticks, self._scale, out=signals)
+        np.add(signals, self._offset, out=signals)
+        # hand out plain floats, not numpy scalars
+        self.signals = signals.tolist()
+        if self._debug_enabled:
             logger.info(
-                "RC CH1 signal:%s, RC CH2 signal:%s, RC CH3 signal:%s",
-                round(self.signals[0], 3),
-                round(self.signals[1], 3),
-                round(self.signals[2], 3)
-            )
+                "RC CH1 signal:%.3f, RC CH2 signal:%.3f, RC CH3 signal:%.3f",
+                *self.signals)
 
         if (self.signals[2] - self.jitter) > 0:
             self.mode = 'local'
@@ -412,6 +704,8 @@ class RCReceiver:
         return self.signals[0], self.signals[1], self.mode, is_action
 
     def shutdown(self):
+        # only this receiver's callbacks are cancelled; the pigpio
+        # connection is shared and stays open for the process lifetime
         for cb in self.cbs:
             try:
                 cb.cancel()
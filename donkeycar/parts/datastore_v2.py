@@ -5,12 +5,96 @@ import mmap
 import os
 import time
 import logging
+import math
+from itertools import accumulate
 from pathlib import Path
 
+import numpy as np
+
+# orjson is several times faster than the json module for the small dicts
+# written once per record; fall back to the json module when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 NEWLINE = '\n'
 NEWLINE_STRIP = '\r\n'
+# Seekable works on bytes; records are utf-8 encoded json
+NEWLINE_B = b'\n'
+NEWLINE_STRIP_B = b'\r\n'
+CARRIAGE_RETURN_B = b'\r'
+
+
+def _json_default(obj):
+    # numpy arrays and scalars, e.g. the numpy.float64 items of a 'vector'
+    # input
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+def _json_dumps(obj):
+    return json.dumps(obj, allow_nan=False, sort_keys=True,
+                      default=_json_default)
+
+
+def _check_finite(obj):
+    """ Raise ValueError on NaN or infinity in obj, like
+        json.dumps(allow_nan=False) does. """
+    if isinstance(obj, (float, np.floating)):
+        finite = math.isfinite(obj)
+    elif isinstance(obj, dict):
+        for value in obj.values():
+            _check_finite(value)
+        return
+    elif isinstance(obj, (list, tuple)):
+        for value in obj:
+            _check_finite(value)
+        return
+    elif isinstance(obj, np.ndarray):
+        finite = obj.dtype.kind not in 'fc' or np.isfinite(obj).all()
+    else:
+        return
+    if not finite:
+        raise ValueError('Out of range float values are not JSON compliant')
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS \
+        | orjson.OPT_SERIALIZE_NUMPY
+    _ORJSON_LINE_OPTIONS = _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
+
+    def _orjson_dumps(obj, option, suffix):
+        # orjson writes NaN and infinity as null, reject them up front
+        _check_finite(obj)
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option)
+        except TypeError:
+            # values orjson does not handle, e.g. integers above 64 bit
+            return (_json_dumps(obj) + suffix).encode('utf-8')
+
+    def _dumps(obj):
+        return _orjson_dumps(obj, _ORJSON_OPTIONS, '')
+
+    def _dumps_line(obj):
+        # newline terminated, so Seekable.writeline() does not copy it to
+        # append one
+        return _orjson_dumps(obj, _ORJSON_LINE_OPTIONS, NEWLINE)
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return _json_dumps(obj).encode('utf-8')
+
+    def _dumps_line(obj):
+        return (_json_dumps(obj) + NEWLINE).encode('utf-8')
+
+    _loads = json.loads
 
 
 class Seekable(object):
@@ -18,29 +102,38 @@ class Seekable(object):
     A seekable file reader, writer which deals with newline delimited
     records. \n
     This reader maintains an index of line lengths, so seeking a line is a
-    O(1) operation.
+    O(1) operation. \n
+    With flush_each=False written lines stay in the file buffer until
+    flush() or close() is called.
     """
 
-    def __init__(self, file, read_only=False, line_lengths=None):
+    def __init__(self, file, read_only=False, line_lengths=None,
+                 flush_each=True):
         if line_lengths is None:
             line_lengths = list()
+        self._flush_each = flush_each
         self.line_lengths = list()
-        self.cumulative_lengths = list()
-        self.method = 'r' if read_only else 'a+'
+        # offsets of the line ends, rebuilt from line_lengths on the first
+        # seek after a write rather than maintained on every write
+        self._cumulative_lengths = None
+        self.method = 'rb' if read_only else 'ab+'
         # Keep a reference to the underlying file object so we can close it
         # deterministically on Windows. When read-only, create an mmap on the
         # file descriptor and keep both the mmap and the backing file around
         # so they can be closed properly later.
-        # Specify an explicit encoding to avoid relying on the system default.
-        self._backing_file = open(
-            file, self.method, newline=NEWLINE, encoding='utf-8')
+        # The file is binary: lines are written as utf-8 bytes, so serialized
+        # json does not take a trip through the text layer.
+        self._backing_file = open(file, self.method)
         # If file is read only improve performance by memory mapping the file.
         # On Windows memory-mapped files can keep the underlying file locked
         # even after closing which interferes with test cleanup. Avoid mmap on
         # Windows to ensure temp files can be removed during tests.
-        if self.method == 'r' and os.name != 'nt':
+        if read_only and os.name != 'nt':
             self.file = mmap.mmap(self._backing_file.fileno(), length=0,
                                   access=mmap.ACCESS_READ)
+            # lines are scanned front to back, ask for aggressive read-ahead
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                self.file.madvise(mmap.MADV_SEQUENTIAL)
         else:
             # For non-mmap or on Windows, use the standard file object for
             # simpler semantics and predictable closing behavior.
@@ -50,74 +143,99 @@ class Seekable(object):
             self._read_contents()
         else:
             self.line_lengths.extend(line_lengths)
-            for line_length in self.line_lengths:
-                self.total_length += line_length
-                self.cumulative_lengths.append(self.total_length)
+            self._accumulate_lengths()
+            # the lengths are persisted apart from the file and lag behind
+            # it when the writer did not close cleanly
+            if self.total_length != os.fstat(
+                    self._backing_file.fileno()).st_size:
+                self._read_contents()
+
+    def _accumulate_lengths(self):
+        self._cumulative_lengths = None
+        self.total_length = sum(self.line_lengths)
+
+    @property
+    def cumulative_lengths(self):
+        if self._cumulative_lengths is None:
+            self._cumulative_lengths = list(accumulate(self.line_lengths))
+        return self._cumulative_lengths
 
     def _read_contents(self):
-        self.line_lengths.clear()
-        self.cumulative_lengths.clear()
-        self.total_length = 0
         self.file.seek(0)
-        contents = self.file.readline()
-        while len(contents) > 0:
-            line_length = len(contents)
-            self.line_lengths.append(line_length)
-            self.total_length += line_length
-            self.cumulative_lengths.append(self.total_length)
-            contents = self.file.readline()
+        # scan for newlines with find(), which runs in C (memchr), instead
+        # of reading the file line by line
+        contents = self.file if isinstance(self.file, mmap.mmap) \
+            else self.file.read()
+        find = contents.find
+        line_lengths = list()
+        start = 0
+        end = find(NEWLINE_B)
+        while end >= 0:
+            line_lengths.append(end + 1 - start)
+            start = end + 1
+            end = find(NEWLINE_B, start)
+        if start < len(contents):
+            # last line without a terminating newline
+            line_lengths.append(len(contents) - start)
+        self.line_lengths.clear()
+        self.line_lengths.extend(line_lengths)
+        self._accumulate_lengths()
         self.seek_end_of_file()
 
     def __enter__(self):
         return self
 
     def writeline(self, contents):
-        ''' Write a line to the seekable file. '''
-        if self.method == 'r':
+        ''' Write a line, given as bytes or str, to the seekable file. '''
+        if self.method == 'rb':
             raise RuntimeError(f'Seekable {self.file} is read-only.')
 
-        has_newline = contents[-1] == NEWLINE
-        if has_newline:
+        if isinstance(contents, str):
+            contents = contents.encode('utf-8')
+        if contents.endswith(NEWLINE_B):
             line = contents
         else:
-            line = f'{contents}{NEWLINE}'
+            line = contents + NEWLINE_B
 
         offset = len(line)
         self.total_length += offset
         self.line_lengths.append(offset)
-        self.cumulative_lengths.append(self.total_length)
+        self._cumulative_lengths = None
         self.file.write(line)
-        self.file.flush()
+        if self._flush_each:
+            self.file.flush()
 
-    def _line_start_offset(self, line_number):
-        return self._offset_until(line_number - 1)
-
-    def _line_end_offset(self, line_number):
-        return self._offset_until(line_number)
+    def flush(self):
+        if self.method != 'rb':
+            self.file.flush()
 
     def _offset_until(self, line_index):
+        # offset of the end of the line, 0 before the first line and past
+        # the last one
         end_index = line_index - 1
-        return self.cumulative_lengths[end_index] \
-            if 0 <= end_index < len(self.cumulative_lengths) else 0
+        if end_index < 0:
+            return 0
+        try:
+            return self.cumulative_lengths[end_index]
+        except IndexError:
+            return 0
 
     def readline(self):
-        contents = self.file.readline()
-        # When Seekable is a memory mapped file, readline() returns a `bytes`
-        if isinstance(contents, bytes):
-            contents = contents.decode(encoding='utf-8')
-        return contents.rstrip(NEWLINE_STRIP)
+        return self.readline_bytes().decode('utf-8')
+
+    def readline_bytes(self):
+        ''' Read the next line as bytes, without the line terminator. '''
+        return self.file.readline().rstrip(NEWLINE_STRIP_B)
 
     def seek_line_start(self, line_number):
-        self.file.seek(self._line_start_offset(line_number))
+        self.file.seek(self._offset_until(line_number - 1))
 
     def seek_end_of_file(self):
         self.file.seek(self.total_length)
 
     def truncate_until_end(self, line_number):
         self.line_lengths = self.line_lengths[:line_number]
-        self.cumulative_lengths = self.cumulative_lengths[:line_number]
-        self.total_length = self.cumulative_lengths[-1] \
-            if len(self.cumulative_lengths) > 0 else 0
+        self._accumulate_lengths()
         self.seek_end_of_file()
         self.file.truncate()
 
@@ -188,21 +306,30 @@ class Catalog(object):
         self.manifest = CatalogMetadata(self.path,
                                         read_only=read_only,
                                         start_index=start_index)
+        # records are appended at the sample rate, leave them in the file
+        # buffer and flush in batches, see flush()
         self.seekable = Seekable(self.path.as_posix(),
                                  line_lengths=self.manifest.line_lengths(),
-                                 read_only=read_only)
+                                 read_only=read_only,
+                                 flush_each=False)
 
     def _exit_handler(self):
         self.close()
 
     def write_record(self, record):
         # Add record and update manifest
-        contents = json.dumps(record, allow_nan=False, sort_keys=True)
+        contents = _dumps_line(record)
         self.seekable.writeline(contents)
         line_lengths = self.seekable.line_lengths
         self.manifest.update_line_lengths(line_lengths)
 
+    def flush(self):
+        # records first, so the line lengths never point past them
+        self.seekable.flush()
+        self.manifest.flush()
+
     def close(self):
+        self.flush()
         self.manifest.close()
         self.seekable.close()
 
@@ -224,12 +351,13 @@ class CatalogMetadata(object):
         self.manifest_path = Path(os.path.join(path.parent.as_posix(),
                                                manifest_name))
         self.seekeable = Seekable(self.manifest_path, read_only=read_only)
+        self._dirty = False
         has_contents = False
         if os.path.exists(self.manifest_path) and self.seekeable.has_content():
             self.seekeable.seek_line_start(1)
-            contents = self.seekeable.readline()
+            contents = self.seekeable.readline_bytes()
             if contents:
-                self.contents = json.loads(contents)
+                self.contents = _loads(contents)
                 has_contents = True
 
         if not has_contents:
@@ -243,8 +371,14 @@ class CatalogMetadata(object):
             self._update()
 
     def update_line_lengths(self, new_lengths):
+        # rewriting the whole line length list per record is quadratic,
+        # it is written by flush() instead
         self.contents['line_lengths'] = new_lengths
-        self._update()
+        self._dirty = True
+
+    def flush(self):
+        if self._dirty:
+            self._update()
 
     def line_lengths(self):
         return self.contents['line_lengths']
@@ -253,11 +387,13 @@ class CatalogMetadata(object):
         return self.contents['start_index']
 
     def _update(self):
-        contents = json.dumps(self.contents, allow_nan=False, sort_keys=True)
+        contents = _dumps(self.contents)
         self.seekeable.truncate_until_end(0)
         self.seekeable.writeline(contents)
+        self._dirty = False
 
     def close(self):
+        self.flush()
         self.seekeable.close()
 
 
@@ -272,6 +408,11 @@ class Manifest(object):
     [ json object with catalog metadata ]\n
     '''
 
+    METADATA_FLUSH_INTERVAL = 64
+    # and at least this often, which bounds the records held in the write
+    # buffer that a hard stop (power off, kill) loses
+    METADATA_FLUSH_SECONDS = 1.0
+
     def __init__(self, base_path, inputs=[], types=[], metadata=[],
                  max_len=1000, read_only=False):
         self.base_path = Path(os.path.expanduser(base_path)).absolute()
@@ -283,15 +424,21 @@ class Manifest(object):
         self.manifest_metadata = dict()
         self.max_len = max_len
         self.read_only = read_only
-        # Do not keep a persistent Catalog object open. Open catalogs
-        # on-demand for reads/writes to avoid lingering file handles on
-        # platforms such as Windows.
+        # The last catalog is opened lazily by write_record() and kept open
+        # for appending; it is closed on rotation and in close() so no
+        # handles linger on platforms such as Windows.
         self.current_catalog = None
         self.current_index = 0
         self.catalog_paths = list()
         self.catalog_metadata = dict()
         self.deleted_indexes = set()
+        # the catalog metadata in the manifest is rewritten every
+        # METADATA_FLUSH_INTERVAL records, on catalog rotation and on close
+        # rather than per record; see _recover_current_index()
+        self._unflushed_records = 0
+        self._last_flush = time.monotonic()
         self._updated_session = False
+        self._session_date = None
         self._is_closed = False
         has_catalogs = False
 
@@ -303,6 +450,8 @@ class Manifest(object):
                 if s.has_content():
                     self._read_contents(seekeable=s)
             has_catalogs = len(self.catalog_paths) > 0
+            if has_catalogs:
+                self._recover_current_index()
             logger.info(f'Found datastore at {self.base_path.as_posix()}')
         else:
             created_at = time.time()
@@ -321,8 +470,7 @@ class Manifest(object):
             # create first catalog on disk
             self._add_catalog()
         else:
-            last_known_catalog = os.path.join(self.base_path,
-                                              self.catalog_paths[-1])
+            last_known_catalog = self.catalog_path(-1)
             logger.info(f'Using last catalog {last_known_catalog}')
             # Do not open the catalog here; open on demand when needed.
         # Create a new session_id, which will be added to each record in the
@@ -340,28 +488,23 @@ class Manifest(object):
             (self.current_index % self.max_len) == 0
 
         if new_catalog:
-            # create and initialize a new catalog file (Catalog will write
-            # its manifest entries); we close it immediately after creation
+            # closes the current catalog and creates the next one
             self._add_catalog()
 
-        # Determine the current catalog path (always append to the last)
-        catalog_name = self.catalog_paths[-1]
-        catalog_path = os.path.join(self.base_path, catalog_name)
-        # Open, write, and close the catalog to avoid keeping file handles
-        cat = Catalog(catalog_path,
-                      start_index=self.current_index,
-                      read_only=self.read_only)
-        try:
-            cat.write_record(record)
-        finally:
-            try:
-                cat.close()
-            except Exception:
-                pass
+        if self.current_catalog is None:
+            # always append to the last catalog
+            self.current_catalog = Catalog(self.catalog_path(-1),
+                                           start_index=self.current_index,
+                                           read_only=self.read_only)
+        self.current_catalog.write_record(record)
 
         self.current_index += 1
-        # Update metadata to keep track of the last index
-        self._update_catalog_metadata(update=True)
+        # Update metadata to keep track of the last index, in batches
+        self._unflushed_records += 1
+        if self._unflushed_records >= self.METADATA_FLUSH_INTERVAL or \
+                time.monotonic() - self._last_flush \
+                >= self.METADATA_FLUSH_SECONDS:
+            self.flush()
         # Set session_id update status to True if this method is called at
         # least once. Then session id metadata  will be updated when the
         # session gets closed
@@ -389,21 +532,31 @@ class Manifest(object):
                         f'{max(record_indexes)}')
 
     def _add_catalog(self):
+        self._close_current_catalog()
         current_length = len(self.catalog_paths)
         catalog_name = f'catalog_{current_length}.catalog'
         catalog_path = os.path.join(self.base_path, catalog_name)
-        # Create and initialize the new catalog (manifest) then close it.
-        tmp_cat = Catalog(catalog_path,
-                          start_index=self.current_index,
-                          read_only=self.read_only)
-        try:
-            tmp_cat.close()
-        except Exception:
-            pass
+        # Create and initialize the new catalog (manifest), it stays open
+        # as the append target of write_record()
+        self.current_catalog = Catalog(catalog_path,
+                                       start_index=self.current_index,
+                                       read_only=self.read_only)
         # Store relative paths
         self.catalog_paths.append(catalog_name)
         self._update_catalog_metadata(update=True)
 
+    def catalog_path(self, catalog_index):
+        """ Absolute path of the catalog at catalog_index."""
+        return os.path.join(self.base_path, self.catalog_paths[catalog_index])
+
+    def _close_current_catalog(self):
+        if self.current_catalog is not None:
+            try:
+                self.current_catalog.close()
+            except Exception:
+                pass
+            self.current_catalog = None
+
     def _read_metadata(self, metadata=[]):
         self.metadata = dict()
         for kv in metadata:
@@ -423,8 +576,8 @@ class Manifest(object):
             return
 
         seekeable.seek_line_start(1)
-        manifest_inputs = json.loads(seekeable.readline())
-        manifest_types = json.loads(seekeable.readline())
+        manifest_inputs = _loads(seekeable.readline_bytes())
+        manifest_types = _loads(seekeable.readline_bytes())
         if not self.inputs and not self.types:
             self.inputs = manifest_inputs
             self.types = manifest_types
@@ -437,10 +590,10 @@ class Manifest(object):
                 f'stored inputs: {manifest_inputs}, new types {self.types}'\
                 f' vs stored types: {manifest_types}'
         # Continue reading manifest lines from the provided Seekable
-        self.metadata = json.loads(seekeable.readline())
-        self.manifest_metadata = json.loads(seekeable.readline())
+        self.metadata = _loads(seekeable.readline_bytes())
+        self.manifest_metadata = _loads(seekeable.readline_bytes())
         # Catalog metadata
-        catalog_metadata = json.loads(seekeable.readline())
+        catalog_metadata = _loads(seekeable.readline_bytes())
         self.catalog_paths = catalog_metadata['paths']
         self.current_index = catalog_metadata['current_index']
         self.max_len = catalog_metadata['max_len']
@@ -450,18 +603,14 @@ class Manifest(object):
         # Open the manifest file transiently to write initial contents.
         with Seekable(self.manifest_path, read_only=self.read_only) as s:
             s.truncate_until_end(0)
-            s.writeline(json.dumps(self.inputs))
-            s.writeline(json.dumps(self.types))
-            s.writeline(json.dumps(self.metadata))
-            s.writeline(json.dumps(self.manifest_metadata))
-            # update catalog metadata in the same file
-            # (this writes the 5th line)
-            s.writeline(json.dumps({}))
-        # Now update the catalog metadata properly
-        self._update_catalog_metadata(update=False)
-
-    def _update_catalog_metadata(self, update=True):
-        # Update the manifest file's catalog metadata (line 5).
+            s.writeline(_dumps(self.inputs))
+            s.writeline(_dumps(self.types))
+            s.writeline(_dumps(self.metadata))
+            s.writeline(_dumps(self.manifest_metadata))
+            # catalog metadata is the 5th line
+            s.writeline(_dumps(self._build_catalog_metadata()))
+
+    def _build_catalog_metadata(self):
         catalog_metadata = dict()
         catalog_metadata['paths'] = self.catalog_paths
         catalog_metadata['current_index'] = self.current_index
@@ -469,12 +618,60 @@ class Manifest(object):
         catalog_metadata['deleted_indexes'] = sorted(
             list(self.deleted_indexes))
         self.catalog_metadata = catalog_metadata
+        self._unflushed_records = 0
+        return catalog_metadata
+
+    def _update_catalog_metadata(self, update=True):
+        # Update the manifest file's catalog metadata (line 5).
+        catalog_metadata = self._build_catalog_metadata()
 
         # Open manifest transiently and update the 5th line.
         with Seekable(self.manifest_path, read_only=self.read_only) as s:
             if update:
                 s.truncate_until_end(4)
-            s.writeline(json.dumps(catalog_metadata))
+            s.writeline(_dumps(catalog_metadata))
+
+    def _recover_current_index(self):
+        # The catalog metadata may lag behind the last catalog by up to
+        # METADATA_FLUSH_INTERVAL records or METADATA_FLUSH_SECONDS if the
+        # tub was not closed cleanly. Records that reached the catalog file
+        # are counted to find the real next index, records still in the
+        # write buffer at the time are lost. A hard stop can also leave a
+        # partial last line, it is cut off so the next record is not
+        # appended to it. The catalog's line lengths then no longer match
+        # the file and Seekable rescans them when the catalog is opened.
+        catalog_path = self.catalog_path(-1)
+        try:
+            with open(catalog_path, 'rb' if self.read_only else 'rb+') as f:
+                contents = f.read()
+                end = contents.rfind(NEWLINE_B) + 1
+                if end < len(contents) and not self.read_only:
+                    logger.warning(f'Dropping partial record at the end of '
+                                   f'{catalog_path}')
+                    f.truncate(end)
+            lines = contents.count(NEWLINE_B)
+            catalog_metadata = CatalogMetadata(catalog_path, read_only=True)
+        except (OSError, ValueError):
+            # missing or empty catalog (manifest), nothing to recover
+            return
+        try:
+            current_index = catalog_metadata.start_index() + lines
+        finally:
+            catalog_metadata.close()
+        if current_index > self.current_index:
+            logger.warning(f'Recovered {current_index - self.current_index}'
+                           f' records not recorded in the manifest')
+            self.current_index = current_index
+
+    def flush(self):
+        """ Write buffered records and catalog metadata still pending from
+            write_record(). """
+        # flush records first so the metadata never points past them
+        if self.current_catalog is not None:
+            self.current_catalog.flush()
+        if self._unflushed_records and not self.read_only:
+            self._update_catalog_metadata(update=True)
+        self._last_flush = time.monotonic()
 
     def _update_session_info(self):
         """ Creates a new session id and appends it to the metadata."""
@@ -491,8 +688,14 @@ class Manifest(object):
         """ Creates a new session id and appends it to the metadata."""
         sessions = self.manifest_metadata.get('sessions', {})
         new_id = sessions['last_id'] + 1 if sessions else 0
-        new_full_id = f"{time.strftime('%y-%m-%d')}_{new_id}"
-        return new_id, new_full_id
+        return new_id, self._new_session_full_id(new_id)
+
+    def _new_session_full_id(self, new_id):
+        # The date is formatted once per Manifest, so a session keeps its
+        # date if it runs past midnight and strftime stays off any loop.
+        if self._session_date is None:
+            self._session_date = time.strftime('%y-%m-%d')
+        return f'{self._session_date}_{new_id}'
 
     def add_deleted_indexes(self, indexes):
         if isinstance(indexes, int):
@@ -509,22 +712,16 @@ class Manifest(object):
         if not self.manifest_path.exists():
             self._is_closed = True
             return
+        self.flush()
         # If records were received, write updated session_id dictionary into
         # the metadata, otherwise keep the session_id information unchanged
         if self._updated_session:
             logger.info(f'Saving new session {self.session_id[1]}')
             self._update_session_info()
             self.write_metadata()
-        # Close current_catalog if it was left open (most code opens/ closes
-        # catalogs on demand). Be defensive in case it's None.
-        try:
-            if getattr(self, 'current_catalog', None) is not None:
-                try:
-                    self.current_catalog.close()
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # Close the catalog held open for appending; write_record() reopens
+        # it if the manifest is written to again.
+        self._close_current_catalog()
         # Close any transient seekable opened for newly-created manifests.
         if hasattr(self, 'seekeable') and self.seekeable is not None:
             try:
@@ -542,10 +739,15 @@ class Manifest(object):
             pass
 
     def write_metadata(self):
-        # Update manifest lines 3 and 4 transiently.
+        # Update manifest lines 3 and 4 transiently. Line 5 is the catalog
+        # metadata which is also held in memory, so rewrite the three
+        # trailing lines in one pass instead of reading back and rewriting
+        # the tail once per updated line.
         with Seekable(self.manifest_path, read_only=self.read_only) as s:
-            s.update_line(3, json.dumps(self.metadata))
-            s.update_line(4, json.dumps(self.manifest_metadata))
+            s.truncate_until_end(2)
+            s.writeline(_dumps(self.metadata))
+            s.writeline(_dumps(self.manifest_metadata))
+            s.writeline(_dumps(self._build_catalog_metadata()))
 
     def __iter__(self):
         return ManifestIterator(self)
@@ -559,74 +761,77 @@ class ManifestIterator(object):
     """
     An iterator for the Manifest type. \n
 
-    Returns catalog entries lazily when a consumer calls __next__().
+    Returns catalog entries lazily when a consumer calls __next__(). Records
+    are parsed one catalog at a time.
     """
 
     def __init__(self, manifest):
         self.manifest = manifest
-        self.has_catalogs = len(self.manifest.catalog_paths) > 0
+        # make records still buffered by a writer visible to the reader
+        self.manifest.flush()
         self.current_index = 0
         self.current_catalog_index = 0
-        self.current_catalog = None
+        # same set object as the manifest's, so deletions made while
+        # iterating are seen by catalogs not loaded yet
+        self._deleted = self.manifest.deleted_indexes
+        self._batch = iter(())
+
+    def _load_catalog(self, catalog_index):
+        # Read the whole catalog once and split it in C rather than going
+        # through readline() per record.
+        catalog_path = self.manifest.catalog_path(catalog_index)
+        try:
+            with open(catalog_path, 'rb') as f:
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0,
+                                     os.POSIX_FADV_SEQUENTIAL)
+                contents = f.read()
+        except FileNotFoundError:
+            logger.error(f'Missing catalog {catalog_path}')
+            return []
+        # split() already dropped the newlines; test for blank lines
+        # without copying each line, json accepts a leftover '\r'
+        lines = [line for line in contents.split(NEWLINE_B)
+                 if line and line != CARRIAGE_RETURN_B]
+        start = self.current_index
+        self.current_index += len(lines)
+        deleted = self._deleted
+        indexed_lines = enumerate(lines, start)
+        if deleted and not deleted.isdisjoint(range(start,
+                                                     self.current_index)):
+            # Skip over indexes, because they have been marked deleted
+            indexed_lines = [(index, line) for index, line in indexed_lines
+                             if index not in deleted]
+        else:
+            # Most catalogs have no deleted records, parse them without a
+            # membership test per record.
+            try:
+                return [_loads(line) for line in lines]
+            except Exception:
+                pass
+        records = list()
+        for current_index, line in indexed_lines:
+            try:
+                records.append(_loads(line))
+            except Exception:
+                logger.error(f'Failed loading record {current_index}')
+        return records
 
     def __next__(self):
         while True:
-            if not self.has_catalogs:
-                # No catalogs -> close manifest resources and finish.
-                try:
-                    self.manifest.close()
-                except Exception:
-                    pass
-                raise StopIteration('No catalogs')
+            for record in self._batch:
+                return record
 
             if self.current_catalog_index >= len(self.manifest.catalog_paths):
-                # If we have an open catalog, close it before finishing,
-                # and close the manifest so files are released promptly.
-                try:
-                    if self.current_catalog is not None:
-                        self.current_catalog.close()
-                except Exception:
-                    pass
+                # Close the manifest so files are released promptly.
                 try:
                     self.manifest.close()
                 except Exception:
                     pass
                 raise StopIteration('No more catalogs')
 
-            if self.current_catalog is None:
-                current_catalog_path = os.path.join(
-                    self.manifest.base_path,
-                    self.manifest.catalog_paths[self.current_catalog_index])
-                self.current_catalog = Catalog(current_catalog_path,
-                                               read_only=self.manifest.read_only)
-                self.current_catalog.seekable.seek_line_start(1)
-
-            contents = self.current_catalog.seekable.readline()
-            if contents is not None and len(contents) > 0:
-                # Check for current_index when we are ready to advance the
-                # underlying iterator.
-                current_index = self.current_index
-                self.current_index += 1
-                if current_index in self.manifest.deleted_indexes:
-                    # Skip over index, because it has been marked deleted
-                    continue
-                else:
-                    try:
-                        record = json.loads(contents)
-                        return record
-                    except Exception:
-                        logger.error(f'Failed loading record {current_index}')
-                        continue
-            else:
-                # Close the current catalog explicitly so file handles are
-                # released promptly (helps Windows cleanup during tests).
-                try:
-                    if self.current_catalog is not None:
-                        self.current_catalog.close()
-                except Exception:
-                    pass
-                self.current_catalog = None
-                self.current_catalog_index += 1
+            self._batch = iter(self._load_catalog(self.current_catalog_index))
+            self.current_catalog_index += 1
 
     next = __next__
 
@@ -50,6 +50,26 @@ class DelayedTrigger:
         return
 
 
+class LatchedTrigger:
+    '''
+    Hold a trigger until the gate input is true, so a trigger raised while
+    the gate is closed is reported once the gate opens instead of lost.
+    '''
+    def __init__(self):
+        self.latched = False
+
+    def run(self, trigger, gate):
+        if trigger:
+            self.latched = True
+        if gate and self.latched:
+            self.latched = False
+            return True
+        return False
+
+    def shutdown(self):
+        return
+
+
 class PIDController:
     """ Performs a PID computation and returns a control value.
         This is based on the elapsed time (dt) and the current value of the process variable
@@ -1,4 +1,7 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 from donkeycar.config import Config
 
 logger = logging.getLogger(__name__)
@@ -15,10 +18,18 @@ try:
 
     class ImageAugmentation:
         def __init__(self, cfg, key, prob=0.5):
-            aug_list = getattr(cfg, key, [])
-            augmentations = [ImageAugmentation.create(a, cfg, prob)
-                             for a in aug_list]
-            self.augmentations = A.Compose(augmentations)
+            # with p=0 none of the transforms would ever be applied
+            aug_list = getattr(cfg, key, []) if prob > 0 else []
+            augmentations = [aug for aug in
+                             (ImageAugmentation.create(a, cfg, prob)
+                              for a in aug_list)
+                             if aug is not None]
+            # decided once here instead of checking the pipeline per frame
+            self._enabled = bool(augmentations)
+            self.augmentations = A.Compose(augmentations) \
+                if self._enabled else None
+            # created on the first run_batch() call
+            self._pool = None
 
         @classmethod
         def create(cls, aug_type: str, config: Config, prob) -> \
@@ -38,13 +49,35 @@ try:
                 return GaussianBlur(sigma_limit=b_range, blur_limit=(13, 13),
                                     p=prob)
 
+            else:
+                logger.warning(f'Unknown augmentation {aug_type}, ignoring')
+                return None
+
         # Parts interface
         def run(self, img_arr):
-            if len(self.augmentations) == 0:
+            if not self._enabled:
                 return img_arr
             aug_img_arr = self.augmentations(image=img_arr)["image"]
             return aug_img_arr
 
+        def run_batch(self, img_arrs):
+            """ Augment a batch of images. The images are spread over a
+                thread pool, the OpenCV / numpy work in albumentations
+                releases the GIL.
+            """
+            if not self._enabled:
+                return list(img_arrs)
+            if len(img_arrs) < 2:
+                return [self.run(img_arr) for img_arr in img_arrs]
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+            return list(self._pool.map(self.run, img_arrs))
+
+        def shutdown(self):
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
 except Exception:  # pragma: no cover - fallback for test/CI environments
     logger.warning(
         'albumentations not available; ImageAugmentation will be a no-op')
@@ -59,3 +92,9 @@ except Exception:  # pragma: no cover - fallback for test/CI environments
 
         def run(self, img_arr):
             return img_arr
+
+        def run_batch(self, img_arrs):
+            return list(img_arrs)
+
+        def shutdown(self):
+            pass
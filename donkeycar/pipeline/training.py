@@ -42,6 +42,11 @@ class BatchSequence(object):
         self.transformation = ImageTransformations(config, 'TRANSFORMATIONS')
         self.post_transformation = ImageTransformations(config,
                                                         'POST_TRANSFORMATIONS')
+        # Training images are augmented a batch at a time. Sequence models
+        # stack several frames into one img_in, which the augmentation and
+        # the post transformations can't take, so those models stay on the
+        # per frame image_processor().
+        self.batch_augment = is_train and model.seq_size() == 0
         self.pipeline = self._create_pipeline()
 
     def __len__(self) -> int:
@@ -61,12 +66,44 @@ class BatchSequence(object):
 
         return img_arr
 
+    def _transform_image(self, img_arr):
+        """ Only the transformations before the augmentation, in training
+        the augmentation and the rest are applied per batch in
+        _augmented_pipeline() """
+        assert img_arr.dtype == np.uint8, \
+            f"_transform_image requires uint8 array but not {img_arr.dtype}"
+        return self.transformation.run(img_arr)
+
+    def _finish_batch(self, batch):
+        """ Augments the images of a batch of x, y tuples together, so
+        ImageAugmentation.run_batch() can spread them over its thread pool,
+        then applies the post transformations and the normalisation """
+        img_arrs = self.augmentation.run_batch([x['img_in'] for x, _ in batch])
+        for (x, _), img_arr in zip(batch, img_arrs):
+            img_arr = self.post_transformation.run(img_arr)
+            x['img_in'] = normalize_image(img_arr)
+        return batch
+
+    def _augmented_pipeline(self):
+        """ Iterates the pipeline in chunks of the batch size and finishes
+        the images of each chunk with _finish_batch() """
+        batch = []
+        for xy in self.pipeline:
+            batch.append(xy)
+            if len(batch) == self.batch_size:
+                yield from self._finish_batch(batch)
+                batch = []
+        yield from self._finish_batch(batch)
+
     def _create_pipeline(self) -> TfmIterator:
         """ This can be overridden if more complicated pipelines are
             required """
         # 1. Initialise TubRecord -> x, y transformations
         def get_x(record: TubRecord) -> Dict[str, Union[float, np.ndarray]]:
             """ Extracting x from record for training"""
+            if self.batch_augment:
+                # augmented, post transformed and normalised per batch
+                return self.model.x_transform(record, self._transform_image)
             out_dict = self.model.x_transform(record, self.image_processor)
             # apply the normalisation here on the fly to go from uint8 -> float
             out_dict['img_in'] = normalize_image(out_dict['img_in'])
@@ -84,8 +121,10 @@ class BatchSequence(object):
 
     def create_tf_data(self) -> tf.data.Dataset:
         """ Assembles the tf data pipeline """
+        generator = self._augmented_pipeline if self.batch_augment \
+            else lambda: self.pipeline
         dataset = tf.data.Dataset.from_generator(
-            generator=lambda: self.pipeline,
+            generator=generator,
             output_types=self.model.output_types(),
             output_shapes=self.model.output_shapes())
         return dataset.repeat().batch(self.batch_size)
@@ -165,6 +204,9 @@ def train(cfg: Config, tub_paths: str, model: str = None,
                        min_delta=cfg.MIN_DELTA,
                        patience=cfg.EARLY_STOP_PATIENCE,
                        show_plot=cfg.SHOW_PLOT)
+    if 'fastai_' not in model_type:
+        # stops the thread pool of ImageAugmentation.run_batch()
+        training_pipe.augmentation.shutdown()
 
     # We are doing the tflite/trt conversion here on a previously saved model
     # and not on the kl.interpreter.model object directly. The reason is that
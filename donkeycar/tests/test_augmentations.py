@@ -0,0 +1,94 @@
+import importlib.util
+import sys
+import threading
+import time
+from types import ModuleType, SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from donkeycar.pipeline import augmentations
+
+
+class StubTransform:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+
+class StubCompose:
+    """ Adds one to the image; later images finish first, so a pool that
+    does not keep the order would be noticed. """
+    def __init__(self, transforms):
+        self.transforms = transforms
+        self.threads = set()
+
+    def __call__(self, image):
+        self.threads.add(threading.get_ident())
+        time.sleep(0.01 / (1 + image[0]))
+        return {'image': image + 1}
+
+
+@pytest.fixture
+def stub_augmentations():
+    """ A copy of the augmentations module built on stub albumentations
+    modules, so the albumentations backed ImageAugmentation can be tested
+    without the package. """
+    albumentations = ModuleType('albumentations')
+    albumentations.Compose = StubCompose
+    albumentations.GaussianBlur = StubTransform
+    core = ModuleType('albumentations.core')
+    transforms_interface = ModuleType(
+        'albumentations.core.transforms_interface')
+    transforms_interface.BasicTransform = StubTransform
+    core.transforms_interface = transforms_interface
+    albumentations.core = core
+    albumentations_augmentations = ModuleType('albumentations.augmentations')
+    albumentations_augmentations.RandomBrightnessContrast = StubTransform
+    stubs = {'albumentations': albumentations,
+             'albumentations.core': core,
+             'albumentations.core.transforms_interface': transforms_interface,
+             'albumentations.augmentations': albumentations_augmentations}
+
+    spec = importlib.util.spec_from_file_location(
+        'augmentations_copy', augmentations.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, stubs):
+        spec.loader.exec_module(module)
+    return module
+
+
+def test_run_batch_keeps_order(stub_augmentations):
+    cfg = SimpleNamespace(AUGMENTATIONS=['BLUR', 'BRIGHTNESS'])
+    aug = stub_augmentations.ImageAugmentation(cfg, 'AUGMENTATIONS')
+    img_arrs = [np.full(3, i) for i in range(8)]
+
+    out = aug.run_batch(img_arrs)
+
+    assert [img[0] for img in out] == list(range(1, 9))
+    assert aug._pool is not None
+    aug.shutdown()
+    assert aug._pool is None
+
+
+def test_run_batch_single_image_skips_pool(stub_augmentations):
+    cfg = SimpleNamespace(AUGMENTATIONS=['BLUR'])
+    aug = stub_augmentations.ImageAugmentation(cfg, 'AUGMENTATIONS')
+
+    out = aug.run_batch([np.zeros(3)])
+
+    assert [img.tolist() for img in out] == [[1, 1, 1]]
+    assert aug.run_batch([]) == []
+    assert aug._pool is None
+    assert aug.augmentations.threads == {threading.get_ident()}
+    aug.shutdown()
+
+
+def test_run_batch_disabled_returns_images(stub_augmentations):
+    cfg = SimpleNamespace(AUGMENTATIONS=['BLUR'])
+    aug = stub_augmentations.ImageAugmentation(cfg, 'AUGMENTATIONS', prob=0)
+    img_arrs = [np.zeros(3), np.ones(3)]
+
+    out = aug.run_batch(img_arrs)
+    assert len(out) == 2 and all(a is b for a, b in zip(out, img_arrs))
+    assert aug._pool is None
@@ -18,6 +18,8 @@ class TestCatalog(unittest.TestCase):
         catalog = Catalog(self._catalog_path)
         for i in range(0, 10):
             catalog.write_record(self._newRecord())
+        # records are buffered until flushed
+        catalog.flush()
 
         self.assertEqual(os.path.exists(catalog.path.as_posix()), True)
         self.assertEqual(os.path.exists(catalog.manifest.manifest_path.as_posix()), True)
@@ -33,6 +35,37 @@ class TestCatalog(unittest.TestCase):
 
         self.assertEqual(count, 10)
 
+    def test_line_lengths_written_on_flush(self):
+        catalog = Catalog(self._catalog_path)
+        for i in range(0, 5):
+            catalog.write_record(self._newRecord())
+        metadata = CatalogMetadata(self._catalog_path, read_only=True)
+        self.assertEqual(metadata.line_lengths(), [])
+        metadata.close()
+
+        catalog.close()
+        metadata = CatalogMetadata(self._catalog_path, read_only=True)
+        self.assertEqual(metadata.line_lengths(),
+                         catalog.seekable.line_lengths)
+        metadata.close()
+
+    def test_stale_line_lengths_rescanned(self):
+        catalog = Catalog(self._catalog_path)
+        catalog.write_record(self._newRecord())
+        catalog.close()
+        catalog = Catalog(self._catalog_path)
+        for i in range(0, 4):
+            catalog.write_record(self._newRecord())
+        # records reach the file, the line lengths are not persisted
+        catalog.seekable.flush()
+
+        catalog_2 = Catalog(self._catalog_path, read_only=True)
+        self.assertEqual(catalog_2.seekable.lines(), 5)
+        catalog_2.seekable.seek_line_start(5)
+        self.assertTrue(catalog_2.seekable.readline())
+        catalog_2.close()
+        catalog.close()
+
     def tearDown(self):
         shutil.rmtree(self._path)
 
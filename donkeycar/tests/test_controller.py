@@ -1,6 +1,11 @@
+import os
+import selectors
+import struct
 import pytest
 from .setup import on_pi
-from donkeycar.parts.controller import PS3Joystick, PS3JoystickController
+from donkeycar.parts.controller import PS3Joystick, PS3JoystickController, \
+    LogitechJoystickController, Nimbus, NimbusController, pack_js_message, \
+    unpack_js_message
 
 
 def test_ps3_joystick():
@@ -30,4 +35,80 @@ def test_ps3_joystick_controller():
     js.toggle_mode()
     js.chaos_monkey_on_left()
     js.chaos_monkey_on_right()
-    js.chaos_monkey_off()
\ No newline at end of file
+    js.chaos_monkey_off()
+
+
+def test_nimbus_controller_dispatch():
+    # few bindings, so this exercises the linear-scan dispatch
+    js = NimbusController()
+    js._dispatch(None, None, 'lx', 0.5)
+    assert js.angle == 0.5
+
+    pressed = []
+    js.set_button_down_trigger('x', lambda: pressed.append('down'))
+    js.set_button_up_trigger('x', lambda: pressed.append('up'))
+    js._dispatch('x', 1, None, None)
+    js._dispatch('x', 0, None, None)
+    js._dispatch('unmapped', 1, 'unmapped', 1.0)
+    assert pressed == ['down', 'up']
+
+
+def test_joystick_controller_dispatch_large_map():
+    js = PS3JoystickController()
+    pressed = []
+    for i in range(js.SMALL_TRIGGER_MAP_SIZE + 1):
+        js.set_button_down_trigger('btn%d' % i,
+                                   lambda i=i: pressed.append(i))
+    js._dispatch('btn3', 1, None, None)
+    js._dispatch(None, None, 'left_stick_horz', -0.5)
+    assert pressed == [3]
+    assert js.angle == -0.5
+
+
+def test_joystick_controller_binds_triggers_by_index():
+    ctr = NimbusController()
+    js = Nimbus()
+    js.axis_map = ['lx', 'ly']
+    js.button_map = ['a', 'b']
+    read_fd, write_fd = os.pipe()
+    js.jsdev = read_fd
+    js._selector.register(read_fd, selectors.EVENT_READ)
+    ctr.js = js
+    ctr._bind_js_triggers()
+    try:
+        os.write(write_fd, struct.pack('IhBB', 0, 32767, 0x02, 0) +
+                 struct.pack('IhBB', 0, 1, 0x01, 1))
+        # events are dispatched by the device, not returned
+        assert js.poll() == (None, None, None, None)
+        assert ctr.angle == 1.0
+        assert ctr.mode == 'local_angle'
+    finally:
+        js.shutdown()
+        os.close(write_fd)
+
+
+@pytest.mark.parametrize('message', [
+    ('cross', 1, None, None),
+    (None, None, 'left_stick_horz', -0.5),
+    ('L1', 0, 'right_stick_vert', 0.25),
+])
+def test_js_message_round_trip(message):
+    button, button_state, axis, axis_val = unpack_js_message(
+        pack_js_message(*message))
+    assert button == message[0]
+    assert axis == message[2]
+    if button is not None:
+        assert button_state == message[1]
+    if axis is not None:
+        assert axis_val == pytest.approx(message[3])
+
+
+def test_logitech_controller_dpad_axes():
+    js = LogitechJoystickController()
+    scale = js.throttle_scale
+    js.on_axis_dpad_UD(1.0)
+    assert js.throttle_scale == pytest.approx(scale - 0.01)
+    js.on_axis_dpad_UD(-1.0)
+    assert js.throttle_scale == pytest.approx(scale)
+    js.on_axis_dpad_UD(0.0)
+    assert js.throttle_scale == pytest.approx(scale)
@@ -1,15 +1,52 @@
 """Unit tests for controller_device module."""
 
+import copy
+import os
+import selectors
+import struct
+from types import SimpleNamespace
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from donkeycar.parts.controller_device import (
     Channel,
     RCReceiver,
     Joystick,
     PyGameJoystick,
+    joystick_profile,
 )
 
 
+@pytest.fixture(scope='module')
+def _mock_config_proto():
+    """Build the configuration object once per module."""
+    return SimpleNamespace(
+        STEERING_RC_GPIO=17,
+        THROTTLE_RC_GPIO=27,
+        DATA_WIPER_RC_GPIO=22,
+        PIGPIO_STEERING_MID=1500,
+        PIGPIO_MAX_FORWARD=2000,
+        PIGPIO_STOPPED_PWM=1500,
+        PIGPIO_MAX_REVERSE=1000,
+        AUTO_RECORD_ON_THROTTLE=False,
+        PIGPIO_INVERT=False,
+        PIGPIO_JITTER=0.0,
+    )
+
+
+@pytest.fixture
+def mock_config(_mock_config_proto):
+    """Per test copy of the mock configuration, safe to modify."""
+    return copy.copy(_mock_config_proto)
+
+
+def _open_pipe(js):
+    """Attach the read end of a pipe to js as if it were the device."""
+    read_fd, write_fd = os.pipe()
+    js.jsdev = read_fd
+    js._selector.register(read_fd, selectors.EVENT_READ)
+    return read_fd, write_fd
+
+
 class TestChannel:
     """Tests for the Channel class."""
 
@@ -22,6 +59,14 @@ class TestChannel:
         assert channel.tick is None
         assert channel.high_tick is None
 
+    def test_channel_slots(self):
+        """Test that Channel stores its state in slots, not a __dict__."""
+        channel = Channel(17)
+
+        assert not hasattr(channel, '__dict__')
+        with pytest.raises(AttributeError):
+            channel.other = 1
+
     def test_channel_multiple_instances(self):
         """Test creating multiple Channel instances."""
         pin1, pin2, pin3 = 17, 27, 22
@@ -36,21 +81,10 @@ class TestChannel:
 class TestRCReceiver:
     """Tests for the RCReceiver class."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Create a mock configuration object."""
-        config = Mock()
-        config.STEERING_RC_GPIO = 17
-        config.THROTTLE_RC_GPIO = 27
-        config.DATA_WIPER_RC_GPIO = 22
-        config.PIGPIO_STEERING_MID = 1500
-        config.PIGPIO_MAX_FORWARD = 2000
-        config.PIGPIO_STOPPED_PWM = 1500
-        config.PIGPIO_MAX_REVERSE = 1000
-        config.AUTO_RECORD_ON_THROTTLE = False
-        config.PIGPIO_INVERT = False
-        config.PIGPIO_JITTER = 0.0
-        return config
+    @pytest.fixture(scope='class')
+    def receiver(self, _mock_config_proto):
+        """One receiver for the tests that do not change its state."""
+        return RCReceiver(_mock_config_proto)
 
     def test_rc_receiver_initialization(self, mock_config):
         """Test RCReceiver initialization."""
@@ -77,6 +111,16 @@ class TestRCReceiver:
         assert receiver.channels[1].pin == mock_config.THROTTLE_RC_GPIO
         assert receiver.channels[2].pin == mock_config.DATA_WIPER_RC_GPIO
 
+    def test_rc_receiver_channel_lookup_by_pin(self, receiver):
+        """Test that each configured pin maps straight to its channel."""
+        for channel in receiver.channels:
+            assert receiver._pin_to_channel[channel.pin] is channel
+        assert receiver._channel_for_pin(99) is None
+
+    def test_rc_receiver_shares_pigpio_connection(self, mock_config):
+        """Test that receivers share one pigpio daemon connection."""
+        assert RCReceiver(mock_config).pi is RCReceiver(mock_config).pi
+
     def test_rc_receiver_factor_calculation(self, mock_config):
         """Test that factor is calculated correctly."""
         receiver = RCReceiver(mock_config)
@@ -97,33 +141,33 @@ class TestRCReceiver:
 
         assert receiver.debug is True
 
-    def test_rc_receiver_pulse_width_none(self, mock_config):
-        """Test pulse_width with None value."""
-        receiver = RCReceiver(mock_config)
-        result = receiver.pulse_width(None)
-
-        assert result is not None
-        assert abs(result - 0.0) < 1e-9
-
-    def test_rc_receiver_pulse_width_value(self, mock_config):
-        """Test pulse_width with actual value."""
-        receiver = RCReceiver(mock_config)
-        result = receiver.pulse_width(1500)
-
-        assert result == 1500
+    @pytest.mark.parametrize('high, expected', [(None, 0.0), (1500, 1500)])
+    def test_rc_receiver_pulse_width(self, receiver, high, expected):
+        """Test pulse_width with no pulse and with a pulse."""
+        assert receiver.pulse_width(high) == pytest.approx(expected)
 
     def test_rc_receiver_cbf_steering_channel(self, mock_config):
         """Test callback function for steering channel."""
         receiver = RCReceiver(mock_config)
+        pin = mock_config.STEERING_RC_GPIO
 
         # Test high edge
-        receiver.cbf(mock_config.STEERING_RC_GPIO, 1, 1000)
+        receiver.cbf(pin, 1, 1000)
         assert receiver.channels[0].high_tick == 1000
 
         # Test low edge
-        receiver.cbf(mock_config.STEERING_RC_GPIO, 0, 2000)
+        receiver.cbf(pin, 0, 2000)
         assert receiver.channels[0].tick == 1000  # 2000 - 1000
 
+    def test_rc_receiver_cbf_tick_wraparound(self, mock_config):
+        """Test that a pulse spanning the 32 bit tick wrap is measured."""
+        receiver = RCReceiver(mock_config)
+        pin = mock_config.THROTTLE_RC_GPIO
+
+        receiver.cbf(pin, 1, 0xFFFFFF00)
+        receiver.cbf(pin, 0, 0x100)
+        assert receiver.channels[1].tick == 0x200
+
     def test_rc_receiver_cbf_wrong_channel(self, mock_config):
         """Test callback function with wrong GPIO pin."""
         receiver = RCReceiver(mock_config)
@@ -132,9 +176,8 @@ class TestRCReceiver:
         receiver.cbf(99, 1, 1000)
 
         # Should not affect any channels
-        for channel in receiver.channels:
-            assert channel.high_tick is None
-            assert channel.tick is None
+        assert all(channel.high_tick is None and channel.tick is None
+                   for channel in receiver.channels)
 
     def test_rc_receiver_shutdown(self, mock_config):
         """Test shutdown method."""
@@ -144,32 +187,31 @@ class TestRCReceiver:
         # All callbacks should be cancelled
         assert len(receiver.cbs) == 3
 
-    def test_rc_receiver_run_basic(self, mock_config):
-        """Test run method with basic parameters."""
-        receiver = RCReceiver(mock_config)
-
-        steering, throttle, mode, is_action = receiver.run()
+    @pytest.mark.parametrize('kwargs, expected', [
+        ({}, ('user', False)),
+        ({'recording': True}, ('user', True)),
+        ({'mode': 'local'}, ('local', False)),
+    ])
+    def test_rc_receiver_run(self, receiver, kwargs, expected):
+        """Test run method with its mode and recording parameters."""
+        steering, throttle, mode, is_action = receiver.run(**kwargs)
 
         assert isinstance(steering, (int, float))
         assert isinstance(throttle, (int, float))
-        assert mode == 'user'
-        assert is_action is False
-
-    def test_rc_receiver_run_with_recording(self, mock_config):
-        """Test run method with recording parameter."""
-        receiver = RCReceiver(mock_config)
-
-        _steering, _throttle, _mode, is_action = receiver.run(recording=True)
+        assert (mode, is_action) == expected
 
-        assert is_action is True
-
-    def test_rc_receiver_run_with_mode(self, mock_config):
-        """Test run method with mode parameter."""
+    @pytest.mark.parametrize('invert, expected', [(False, 0.5), (True, -0.5)])
+    def test_rc_receiver_run_signal_mapping(self, mock_config, invert,
+                                            expected):
+        """Test the pulse width to signal mapping with and without invert."""
+        mock_config.PIGPIO_INVERT = invert
         receiver = RCReceiver(mock_config)
+        receiver.channels[0].tick = 1750
 
-        _signals, _throttle, mode, _is_action = receiver.run(mode='local')
+        steering, _throttle, _mode, _is_action = receiver.run()
 
-        assert mode == 'local'
+        assert steering == pytest.approx(expected)
+        assert isinstance(steering, float)
 
 
 class TestJoystick:
@@ -185,8 +227,8 @@ class TestJoystick:
         assert isinstance(js.button_states, dict)
         assert isinstance(js.axis_names, dict)
         assert isinstance(js.button_names, dict)
-        assert isinstance(js.axis_map, list)
-        assert isinstance(js.button_map, list)
+        assert isinstance(js.axis_map, tuple)
+        assert isinstance(js.button_map, tuple)
 
     def test_joystick_custom_dev_fn(self):
         """Test Joystick with custom device file."""
@@ -195,21 +237,197 @@ class TestJoystick:
 
         assert js.dev_fn == custom_dev
 
-    @patch('os.path.exists')
-    def test_joystick_init_missing_device(self, mock_exists):
-        """Test Joystick init when device file doesn't exist."""
-        mock_exists.return_value = False
+    def test_joystick_profile_sets_names(self):
+        """Test that @joystick_profile provides per-instance name maps."""
+        @joystick_profile(axis_names={0x00: 'x'}, button_names={0x130: 'a'})
+        class ProfiledJoystick(Joystick):
+            pass
+
+        js = ProfiledJoystick()
+        assert js.axis_names == {0x00: 'x'}
+        assert js.button_names == {0x130: 'a'}
+
+        # editing an instance must not leak into the class profile
+        js.button_names[0x131] = 'b'
+        assert ProfiledJoystick().button_names == {0x130: 'a'}
+
+    def test_joystick_poll_reads_raw_fd(self):
+        """Test that poll decodes events read from the raw device fd."""
         js = Joystick()
+        js.axis_map = ['x']
+        js.button_map = ['a']
+        read_fd, write_fd = _open_pipe(js)
+        try:
+            os.write(write_fd, struct.pack('IhBB', 0, 32767, 0x02, 0))
+            assert js.poll() == (None, None, 'x', 1.0)
+            os.write(write_fd, struct.pack('IhBB', 0, 1, 0x01, 0))
+            assert js.poll() == ('a', 1, None, None)
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+        assert js.jsdev is None
+
+    def test_joystick_poll_drains_and_collapses_axes(self):
+        """Test that queued axis moves collapse while buttons are kept."""
+        js = Joystick()
+        js.axis_map = ['x']
+        js.button_map = ['a']
+        read_fd, write_fd = _open_pipe(js)
+        try:
+            os.write(write_fd, b''.join([
+                struct.pack('IhBB', 0, 0, 0x82, 0),  # init event, ignored
+                struct.pack('IhBB', 0, 10000, 0x02, 0),
+                struct.pack('IhBB', 0, 1, 0x01, 0),
+                struct.pack('IhBB', 0, 32767, 0x02, 0),
+                struct.pack('IhBB', 0, 0, 0x01, 0),
+            ]))
+            assert js.poll() == (None, None, 'x', 1.0)
+            assert js.poll() == ('a', 1, None, None)
+            assert js.poll() == ('a', 0, None, None)
+            assert js.axis_states['x'] == 1.0
+            assert js.button_states['a'] == 0
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+
+    def test_joystick_poll_events_drains_backlog_in_one_read(self):
+        """Test that a backlog larger than the driver queue is one read."""
+        js = Joystick(poll_timeout=0.01)
+        js.button_map = ['a']
+        _read_fd, write_fd = _open_pipe(js)
+        try:
+            os.write(write_fd, b''.join(
+                struct.pack('IhBB', 0, i % 2, 0x01, 0) for i in range(100)))
+            with patch('os.read', wraps=os.read) as read:
+                assert len(js.poll_events()) == 100
+            assert read.call_count == 1
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+
+    def test_joystick_poll_ignores_partial_event(self):
+        """Test that a trailing partial js_event is dropped."""
+        js = Joystick(poll_timeout=0.01)
+        js.button_map = ['a']
+        _read_fd, write_fd = _open_pipe(js)
+        try:
+            os.write(write_fd, struct.pack('IhBB', 0, 1, 0x01, 0) + b'\0\0\0')
+            assert js.poll_events() == [('a', 1, None, None)]
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+
+    def test_joystick_poll_events_returns_batch(self):
+        """Test that poll_events returns every queued event at once."""
+        js = Joystick(poll_timeout=0.01)
+        js.axis_map = ['x']
+        js.button_map = ['a']
+        _read_fd, write_fd = _open_pipe(js)
+        try:
+            os.write(write_fd, b''.join([
+                struct.pack('IhBB', 0, 1, 0x01, 0),
+                struct.pack('IhBB', 0, 32767, 0x02, 0),
+            ]))
+            assert js.poll_events() == [('a', 1, None, None),
+                                        (None, None, 'x', 1.0)]
+            assert js.poll_events() == []
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+
+    def test_joystick_poll_filters_axis_jitter(self):
+        """Test that tiny axis moves are swallowed but center is kept."""
+        js = Joystick(poll_timeout=0.01)
+        js.axis_map = ['x']
+        js.axis_deadzone = 0.05
+        _read_fd, write_fd = _open_pipe(js)
+        try:
+            for value in (16384, 16400, 1000, 20000):
+                os.write(write_fd, struct.pack('IhBB', 0, value, 0x02, 0))
+                js._drain()
+            events = list(js._pending)
+            assert [e[3] for e in events] == [16384 / 32767.0, 0.0,
+                                              20000 / 32767.0]
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+
+    def test_joystick_drain_without_events(self):
+        """Test that draining an empty non-blocking fd returns nothing."""
+        js = Joystick()
+        _read_fd, write_fd = _open_pipe(js)
+        os.set_blocking(js.jsdev, False)
+        try:
+            js._drain()
+            assert not js._pending
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+
+    def test_joystick_poll_times_out_without_events(self):
+        """Test that poll returns no event once poll_timeout passes."""
+        js = Joystick(poll_timeout=0.01)
+        _read_fd, write_fd = _open_pipe(js)
+        try:
+            assert js.poll() == (None, None, None, None)
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+
+    def test_joystick_poll_timeout_override(self):
+        """Test that an explicit timeout replaces poll_timeout."""
+        js = Joystick(poll_timeout=60.0)
+        _read_fd, write_fd = _open_pipe(js)
+        try:
+            with patch.object(js._selector, 'select',
+                              wraps=js._selector.select) as select:
+                assert js.poll(timeout=0) == (None, None, None, None)
+            select.assert_called_once_with(0)
+        finally:
+            js.shutdown()
+            os.close(write_fd)
+
+    def test_joystick_init_queries_device(self, tmp_path):
+        """Test that init reads name, counts and maps through ioctl."""
+        from donkeycar.parts import controller_device as cd
+
+        def fake_ioctl(_fd, request, buf):
+            if request == cd._JSIOCGNAME64:
+                buf[:5] = b'pad\0x'
+            elif request == cd._JSIOCGAXES:
+                buf[0] = 2
+            elif request == cd._JSIOCGBUTTONS:
+                buf[0] = 1
+            elif request == cd._JSIOCGAXMAP:
+                buf[:2] = bytes([0x00, 0x05])
+            elif request == cd._JSIOCGBTNMAP:
+                buf[0] = 0x130
+
+        # a fifo can be registered with the selector like the device
+        dev = tmp_path / 'js0'
+        os.mkfifo(dev)
+        js = Joystick(dev_fn=str(dev))
+        js.axis_names = {0x00: 'x'}
+        js.button_names = {0x130: 'a'}
+        with patch.object(cd, 'ioctl', fake_ioctl):
+            assert js.init() is True
+        js.shutdown()
+
+        assert js.js_name == 'pad'
+        assert js.axis_map == ('x', 'unknown(0x05)')
+        assert js.button_map == ('a',)
+
+    def test_joystick_init_missing_device(self):
+        """Test Joystick init when device file doesn't exist."""
+        js = Joystick(dev_fn='/nonexistent/input/js0')
 
         result = js.init()
 
         assert result is False
 
-    @patch('os.path.exists')
     @patch('donkeycar.parts.controller_device.ioctl', None)
-    def test_joystick_init_fcntl_not_available(self, mock_exists):
+    def test_joystick_init_fcntl_not_available(self):
         """Test Joystick init when fcntl is not available."""
-        mock_exists.return_value = True
         js = Joystick()
         result = js.init()
 
@@ -219,50 +437,98 @@ class TestJoystick:
 class TestPyGameJoystick:
     """Tests for the PyGameJoystick class."""
 
-    @patch('donkeycar.parts.controller_device.pygame')
-    def test_pygame_joystick_initialization(self, mock_pygame_module):
+    @pytest.fixture
+    def mock_joystick(self):
+        """Patch pygame and return the joystick PyGameJoystick will open."""
+        with patch('donkeycar.parts.controller_device.pygame') as mock_pygame:
+            joystick = MagicMock()
+            joystick.get_numaxes.return_value = 0
+            joystick.get_numbuttons.return_value = 0
+            joystick.get_numhats.return_value = 0
+            joystick.get_name.return_value = 'Test Joystick'
+            mock_pygame.joystick.Joystick.return_value = joystick
+            yield joystick
+
+    def test_pygame_joystick_initialization(self, mock_joystick):
         """Test PyGameJoystick initialization with pygame available."""
-        mock_joystick = MagicMock()
         mock_joystick.get_numaxes.return_value = 2
         mock_joystick.get_numbuttons.return_value = 10
         mock_joystick.get_numhats.return_value = 1
-        mock_joystick.get_name.return_value = "Test Joystick"
 
-        mock_pygame_module.joystick.Joystick.return_value = mock_joystick
         js = PyGameJoystick()
 
         assert js.joystick is not None
         assert len(js.axis_states) == 2
         assert len(js.button_states) == 14  # 10 buttons + 1 hat * 4
 
-    def test_pygame_joystick_initialization_no_pygame(self):
+    def test_pygame_joystick_poll_uses_cached_counts(self, mock_joystick):
+        """Test that poll does not query the control counts again."""
+        mock_joystick.get_numaxes.return_value = 2
+        mock_joystick.get_numbuttons.return_value = 2
+        mock_joystick.get_axis.side_effect = lambda i: [0.5, 0.0][i]
+        mock_joystick.get_button.side_effect = lambda i: [0, 1][i]
+        js = PyGameJoystick()
+        mock_joystick.get_numaxes.reset_mock()
+        mock_joystick.get_numbuttons.reset_mock()
+
+        assert js.poll() == (1, 1, 0, 0.5)
+        mock_joystick.get_numaxes.assert_not_called()
+        mock_joystick.get_numbuttons.assert_not_called()
+
+    def test_pygame_joystick_poll_reports_only_changes(self, mock_joystick):
+        """Test that unchanged and dead zone axis values are not reported."""
+        mock_joystick.get_numaxes.return_value = 3
+        mock_joystick.get_numbuttons.return_value = 1
+        axes = [0.0, 0.05, 0.0]
+        mock_joystick.get_axis.side_effect = lambda i: axes[i]
+        mock_joystick.get_button.return_value = 0
+        js = PyGameJoystick()
+
+        assert js.poll() == (None, None, None, None)
+        axes[0] = -0.5
+        assert js.poll() == (None, None, 0, -0.5)
+        assert js.poll() == (None, None, None, None)
+        assert js.axis_states == [-0.5, 0.0, 0.0]
+        axes[0] = -0.01
+        _button, _state, _axis, axis_val = js.poll()
+        assert axis_val == 0.0
+        assert str(axis_val) == '0.0'
+
+    def test_pygame_joystick_poll_hat_directions(self, mock_joystick):
+        """Test that each hat direction maps to its own virtual button."""
+        mock_joystick.get_numbuttons.return_value = 2
+        mock_joystick.get_numhats.return_value = 1
+        hat = [(0, 0)]
+        mock_joystick.get_hat.side_effect = lambda i: hat[i]
+        mock_joystick.get_button.return_value = 0
+        js = PyGameJoystick()
+
+        assert js.poll() == (None, None, None, None)
+        hat[0] = (1, 0)
+        assert js.poll() == (3, 1, None, None)
+        hat[0] = (1, 1)
+        assert js.poll() == (5, 1, None, None)
+        hat[0] = (0, 0)
+        js.poll()
+        assert js.button_states == [0, 0, 0, 0, 0, 0]
+
+    def test_pygame_joystick_initialization_no_pygame(self, monkeypatch):
         """Test PyGameJoystick initialization when pygame is not available."""
-        with patch.dict('sys.modules', {'pygame': None}):
-            try:
-                js = PyGameJoystick()
-                # If pygame is mocked/unavailable, joystick should be None
-                assert js.joystick is None or isinstance(
-                    js.joystick, (type(None), MagicMock))
-            except (ImportError, RuntimeError, AttributeError):
-                # It's acceptable to raise an exception if pygame is truly unavailable
-                pass
-
-    @patch('donkeycar.parts.controller_device.pygame')
-    def test_pygame_joystick_dead_zone(self, mock_pygame_module):
-        """Test PyGameJoystick dead_zone initialization."""
-        mock_joystick = MagicMock()
-        mock_joystick.get_numaxes.return_value = 0
-        mock_joystick.get_numbuttons.return_value = 0
-        mock_joystick.get_numhats.return_value = 0
-        mock_pygame_module.joystick.Joystick.return_value = mock_joystick
+        monkeypatch.setattr('donkeycar.parts.controller_device.pygame', None)
 
         js = PyGameJoystick()
 
+        assert js.joystick is None
+        assert js.poll() == (None, None, None, None)
+
+    def test_pygame_joystick_dead_zone(self, mock_joystick):
+        """Test PyGameJoystick dead_zone initialization."""
+        js = PyGameJoystick()
+
         # Allow for floating point precision differences
         assert abs(js.dead_zone - 0.07) < 1e-9
 
-    @patch('donkeycar.parts.controller_device.pygame')
-    def test_pygame_joystick_poll_no_joystick(self, _mock_pygame_module):
+    def test_pygame_joystick_poll_no_joystick(self, mock_joystick):
         """Test PyGameJoystick poll when joystick is None."""
         js = PyGameJoystick()
         js.joystick = None
@@ -274,14 +540,10 @@ class TestPyGameJoystick:
         assert axis is None
         assert axis_val is None
 
-    @patch('donkeycar.parts.controller_device.pygame')
-    def test_pygame_joystick_show_map(self, mock_pygame_module):
+    def test_pygame_joystick_show_map(self, mock_joystick):
         """Test PyGameJoystick show_map method."""
-        mock_joystick = MagicMock()
         mock_joystick.get_numaxes.return_value = 2
         mock_joystick.get_numbuttons.return_value = 10
-        mock_joystick.get_numhats.return_value = 0
-        mock_pygame_module.joystick.Joystick.return_value = mock_joystick
 
         with patch('builtins.print') as mock_print:
             js = PyGameJoystick()
@@ -296,29 +558,14 @@ class TestPyGameJoystick:
 class TestIntegration:
     """Integration tests for controller_device classes."""
 
-    @pytest.fixture
-    def mock_config(self):
-        """Create a mock configuration object."""
-        config = Mock()
-        config.STEERING_RC_GPIO = 17
-        config.THROTTLE_RC_GPIO = 27
-        config.DATA_WIPER_RC_GPIO = 22
-        config.PIGPIO_STEERING_MID = 1500
-        config.PIGPIO_MAX_FORWARD = 2000
-        config.PIGPIO_STOPPED_PWM = 1500
-        config.PIGPIO_MAX_REVERSE = 1000
-        config.AUTO_RECORD_ON_THROTTLE = False
-        config.PIGPIO_INVERT = False
-        config.PIGPIO_JITTER = 0.0
-        return config
-
     def test_rc_receiver_full_cycle(self, mock_config):
         """Test RCReceiver through a full cycle."""
         receiver = RCReceiver(mock_config)
+        pin = mock_config.STEERING_RC_GPIO
 
         # Simulate receiving pulses
-        receiver.cbf(mock_config.STEERING_RC_GPIO, 1, 1000)
-        receiver.cbf(mock_config.STEERING_RC_GPIO, 0, 2500)
+        receiver.cbf(pin, 1, 1000)
+        receiver.cbf(pin, 0, 2500)
 
         # Run and get signals
         steering, throttle, _mode, _is_action = receiver.run()
@@ -1,13 +1,31 @@
+import importlib.util
+import math
 import os
 import shutil
+import sys
 import tempfile
 import time
 import unittest
 from pathlib import Path
+from unittest import mock
 
+import numpy as np
+
+from donkeycar.parts import datastore_v2
 from donkeycar.parts.datastore_v2 import Manifest
 
 
+def _datastore_module(with_orjson):
+    """ A separate copy of datastore_v2, with or without orjson. """
+    blocked = {} if with_orjson else {'orjson': None}
+    spec = importlib.util.spec_from_file_location(
+        'datastore_v2_copy', datastore_v2.__file__)
+    module = importlib.util.module_from_spec(spec)
+    with mock.patch.dict(sys.modules, blocked):
+        spec.loader.exec_module(module)
+    return module
+
+
 class TestDatastore(unittest.TestCase):
 
     def setUp(self):
@@ -67,6 +85,125 @@ class TestDatastore(unittest.TestCase):
 
         self.assertEqual(count, read_records)
 
+    def test_records_round_trip(self):
+        manifest = Manifest(self._path, max_len=2)
+        records = [{'at': i, 'user/mode': 'caf\u00e9', 'angle': 0.5}
+                   for i in range(5)]
+        for record in records:
+            manifest.write_record(record)
+
+        self.assertEqual(list(manifest), records)
+
+    def test_deleted_records_skipped_across_catalogs(self):
+        manifest = Manifest(self._path, max_len=3)
+        for i in range(8):
+            manifest.write_record({'at': i})
+
+        manifest.delete_records({1, 3, 4, 7})
+        self.assertEqual([r['at'] for r in manifest], [0, 2, 5, 6])
+
+    def test_crlf_catalog(self):
+        manifest = Manifest(self._path)
+        manifest.write_record({'at': 0})
+        manifest.close()
+        catalog_path = os.path.join(self._path, manifest.catalog_paths[-1])
+        with open(catalog_path, 'ab') as f:
+            f.write(b'{"at": 1}\r\n\r\n')
+
+        manifest_2 = Manifest(self._path, read_only=True)
+        self.assertEqual([r['at'] for r in manifest_2], [0, 1])
+
+    def test_corrupt_record_skipped(self):
+        manifest = Manifest(self._path)
+        for i in range(3):
+            manifest.write_record({'at': i})
+        manifest.close()
+        catalog_path = os.path.join(self._path, manifest.catalog_paths[-1])
+        with open(catalog_path, 'ab') as f:
+            f.write(b'{"at": \n')
+
+        manifest_2 = Manifest(self._path, read_only=True)
+        self.assertEqual([r['at'] for r in manifest_2], [0, 1, 2])
+
+    def test_recovers_index_from_unflushed_metadata(self):
+        manifest = Manifest(self._path)
+        count = Manifest.METADATA_FLUSH_INTERVAL + 10
+        for i in range(count):
+            manifest.write_record(self._newRecord())
+        # records reached the file, the catalog metadata has not
+        manifest.current_catalog.flush()
+
+        # a second reader sees the manifest as left by a crash
+        manifest_2 = Manifest(self._path, read_only=True)
+        self.assertEqual(manifest_2.current_index, count)
+        self.assertEqual(len(list(manifest_2)), count)
+        manifest.close()
+
+    def test_partial_record_dropped_on_reopen(self):
+        manifest = Manifest(self._path)
+        for i in range(10):
+            manifest.write_record({'at': i})
+        manifest.close()
+        # a hard stop left half a line in the write buffer's last chunk
+        catalog_path = os.path.join(self._path, manifest.catalog_paths[-1])
+        with open(catalog_path, 'ab') as f:
+            f.write(b'{"at": 10, "user/an')
+
+        manifest_2 = Manifest(self._path)
+        self.assertEqual(manifest_2.current_index, 10)
+        manifest_2.write_record({'at': 10, 'user/angle': 42.0})
+        manifest_2.close()
+
+        manifest_3 = Manifest(self._path, read_only=True)
+        records = list(manifest_3)
+        self.assertEqual([r['at'] for r in records], list(range(11)))
+        self.assertEqual(records[-1]['user/angle'], 42.0)
+        manifest_3.close()
+
+    def test_metadata_flushed_after_interval_seconds(self):
+        manifest = Manifest(self._path)
+        manifest.METADATA_FLUSH_SECONDS = 0
+        for i in range(3):
+            manifest.write_record(self._newRecord())
+
+        manifest_2 = Manifest(self._path, read_only=True)
+        self.assertEqual(manifest_2.current_index, 3)
+        self.assertEqual(len(list(manifest_2)), 3)
+        manifest.close()
+
+    def test_write_metadata_keeps_catalog_metadata(self):
+        manifest = Manifest(self._path, metadata=['pilot:human'], max_len=2)
+        for i in range(5):
+            manifest.write_record(self._newRecord())
+        manifest.delete_records(2)
+        manifest.metadata['track'] = 'oval'
+        manifest.write_metadata()
+        manifest.close()
+
+        manifest_2 = Manifest(self._path, read_only=True)
+        self.assertEqual(manifest_2.metadata,
+                         {'pilot': 'human', 'track': 'oval'})
+        self.assertEqual(manifest_2.current_index, 5)
+        self.assertEqual(manifest_2.deleted_indexes, {2})
+        self.assertEqual(len(manifest_2.catalog_paths), 3)
+        manifest_2.close()
+
+    def test_catalog_kept_open_until_rotation(self):
+        manifest = Manifest(self._path, max_len=3)
+        manifest.write_record(self._newRecord())
+        catalog = manifest.current_catalog
+        manifest.write_record(self._newRecord())
+        manifest.write_record(self._newRecord())
+        self.assertIs(manifest.current_catalog, catalog)
+        manifest.write_record(self._newRecord())
+        self.assertIsNot(manifest.current_catalog, catalog)
+        self.assertEqual(len(manifest.catalog_paths), 2)
+        manifest.close()
+        self.assertIsNone(manifest.current_catalog)
+
+        manifest_2 = Manifest(self._path, read_only=True)
+        self.assertEqual(len(list(manifest_2)), 4)
+
     def test_memory_mapped_read(self):
         manifest = Manifest(self._path, max_len=2)
         for i in range(10):
@@ -82,6 +219,40 @@ class TestDatastore(unittest.TestCase):
 
         self.assertEqual(10, read_records)
 
+    def _check_numpy_and_nan_records(self, module):
+        manifest = module.Manifest(self._path)
+        # Tub stores 'vector' inputs as a list of numpy scalars
+        manifest.write_record({'v': list(np.array([0.1, 0.2])),
+                               'n': np.int64(3), 'user/mode': None})
+        with self.assertRaises(ValueError):
+            manifest.write_record({'v': [0.1, math.nan]})
+        with self.assertRaises(ValueError):
+            manifest.write_record({'v': list(np.array([np.inf]))})
+        with self.assertRaises(ValueError):
+            manifest.write_record({'a': np.array([1., np.nan]), 'b': None})
+        with self.assertRaises(ValueError):
+            manifest.write_record({'f': np.float32('nan')})
+        manifest.write_record({'a': np.array([1., 2.]), 'b': None,
+                               's': 'null'})
+        manifest.close()
+
+        manifest_2 = module.Manifest(self._path, read_only=True)
+        self.assertEqual(list(manifest_2),
+                         [{'v': [0.1, 0.2], 'n': 3, 'user/mode': None},
+                          {'a': [1., 2.], 'b': None, 's': 'null'}])
+        manifest_2.close()
+
+    @unittest.skipIf(datastore_v2.orjson is None, 'orjson not installed')
+    def test_numpy_and_nan_records_orjson(self):
+        module = _datastore_module(with_orjson=True)
+        self.assertIsNotNone(module.orjson)
+        self._check_numpy_and_nan_records(module)
+
+    def test_numpy_and_nan_records_json(self):
+        module = _datastore_module(with_orjson=False)
+        self.assertIsNone(module.orjson)
+        self._check_numpy_and_nan_records(module)
+
     def tearDown(self):
         shutil.rmtree(self._path)
 
@@ -1 +1,12 @@
+from donkeycar.parts.transform import LatchedTrigger
 
+
+def test_latched_trigger_holds_until_gate_opens():
+    latch = LatchedTrigger()
+
+    assert latch.run(False, True) is False
+    assert latch.run(True, False) is False
+    assert latch.run(False, False) is False
+    assert latch.run(False, True) is True
+    assert latch.run(False, True) is False
+    assert latch.run(True, True) is True
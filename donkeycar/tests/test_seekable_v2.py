@@ -53,6 +53,15 @@ class TestSeekeable(unittest.TestCase):
             self.assertEqual(lines[1], 'Line 2')
             self.assertEqual(lines[2], 'Line 3')
 
+    def test_non_ascii_offsets(self):
+        appendable = Seekable(self._path)
+        with appendable:
+            appendable.writeline('Line \u00e9')
+            appendable.writeline('Line 2')
+            self.assertEqual(appendable.line_lengths, [8, 7])
+            appendable.seek_line_start(2)
+            self.assertEqual(appendable.readline(), 'Line 2')
+
     def test_read_contents(self):
         appendable = Seekable(self._path)
         with appendable:
@@ -63,6 +72,16 @@ class TestSeekeable(unittest.TestCase):
             appendable._read_contents()
             self.assertEqual(len(appendable.line_lengths), 2)
 
+    def test_read_contents_memory_mapped(self):
+        with open(self._path, 'wb') as f:
+            f.write(b'Line 1\nLine 22\nLine 333')
+        readable = Seekable(self._path, read_only=True)
+        with readable:
+            self.assertEqual(readable.line_lengths, [7, 8, 8])
+            self.assertEqual(readable.total_length, 23)
+            readable.seek_line_start(3)
+            self.assertEqual(readable.readline(), 'Line 333')
+
     def test_restore_from_index(self):
         appendable = Seekable(self._path)
         with appendable:
@@ -234,3 +234,49 @@ def test_training_pipeline(config: Config, model_type: str,
             for k, v in batch.items():
                 assert np.isclose(v, np_dict[k]).all()
 
+
+
+class StubPilot:
+    """ Model stand-in that builds img_in from uint8 frames, stacked into
+    (seq, H, W, D) like Keras3D_CNN and KerasLSTM when seq_size > 0. """
+    def __init__(self, seq_size):
+        self._seq_size = seq_size
+
+    def seq_size(self):
+        return self._seq_size
+
+    def x_transform(self, record, img_processor):
+        frame = np.full((120, 160, 3), 200, dtype=np.uint8)
+        if self._seq_size:
+            return {'img_in': np.stack([img_processor(frame)
+                                        for _ in record])}
+        return {'img_in': img_processor(frame)}
+
+    def y_transform(self, record):
+        return {'n_outputs0': 0.0}
+
+
+@pytest.mark.parametrize('seq_size', [0, 3])
+def test_batch_sequence_post_transforms_frames(base_config, seq_size):
+    cfg = copy(base_config)
+    cfg.BATCH_SIZE = 4
+    cfg.AUGMENTATIONS = ['BRIGHTNESS']
+    cfg.POST_TRANSFORMATIONS = ['CROP']
+    cfg.ROI_CROP_TOP = 45
+    cfg.ROI_CROP_BOTTOM = 0
+    cfg.ROI_CROP_RIGHT = 0
+    cfg.ROI_CROP_LEFT = 0
+    records = [[None] * seq_size if seq_size else None for _ in range(6)]
+
+    seq = BatchSequence(StubPilot(seq_size), cfg, records, is_train=True)
+    assert seq.batch_augment == (seq_size == 0)
+    xy = list(seq._augmented_pipeline()) if seq.batch_augment \
+        else list(seq.pipeline)
+
+    assert len(xy) == 6
+    shape = (seq_size, 120, 160, 3) if seq_size else (120, 160, 3)
+    for x, _ in xy:
+        assert x['img_in'].shape == shape
+        # the crop masks the top rows of every frame, then normalises
+        assert (x['img_in'][..., :45, :, :] == 0).all()
+        assert x['img_in'].dtype != np.uint8
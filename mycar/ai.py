@@ -10,6 +10,7 @@ trigger safe reloads while AI is running.
 # pylint: disable=import-error,too-many-lines
 
 from typing import Any
+import os
 import time
 import logging
 
@@ -17,6 +18,36 @@ import donkeycar as dk
 
 logger = logging.getLogger(__name__)
 
+# model files that hold the whole model with weights
+_FULL_MODEL_EXTENSIONS = frozenset(
+    (".h5", ".trt", ".tflite", ".savedmodel", ".pth"))
+
+
+class _ModelReloader:
+    """Reload the model some loops after its file changed, while ai runs.
+
+    One vehicle part for the dirty latch, the delay and the reload
+    callback. It reuses the "modelfile/modified" output of the model
+    FileWatcher, so the file is stat'ed once per loop. A change seen while
+    ai is not running is held until it is.
+    """
+
+    def __init__(self, model_path: str, reload_cb: Any, delay: int = 100):
+        from donkeycar.parts.transform import (
+            DelayedTrigger, LatchedTrigger, TriggeredCallback)
+
+        self.dirty = LatchedTrigger()
+        self.delay = DelayedTrigger(delay)
+        self.reload = TriggeredCallback(model_path, reload_cb)
+
+    def run(self, modified: bool, ai_running: bool) -> None:
+        dirty = self.dirty.run(modified, ai_running)
+        if ai_running:
+            self.reload.run(self.delay.run(dirty))
+
+    def shutdown(self) -> None:
+        return
+
 
 def setup_model_and_watchers(cfg: Any, vehicle: Any, model_path: str, model_type: str) -> None:
     """Set up model part and filesystem watchers for reloads.
@@ -61,8 +92,8 @@ def setup_model_and_watchers(cfg: Any, vehicle: Any, model_path: str, model_type
 
     model_reload_cb = None
 
-    mp = model_path.lower()
-    if mp.endswith((".h5", ".trt", ".tflite", ".savedmodel", ".pth")):
+    ext = os.path.splitext(model_path)[1].lower()
+    if ext in _FULL_MODEL_EXTENSIONS:
         # load the whole model with weights, etc
         load_model(kl, model_path)
 
@@ -71,7 +102,7 @@ def setup_model_and_watchers(cfg: Any, vehicle: Any, model_path: str, model_type
 
         model_reload_cb = reload_model
 
-    elif model_path.lower().endswith(".json"):
+    elif ext == ".json":
         # load the model from there and look for a matching .weights file
         load_model_json(kl, model_path)
         weights_path = model_path.replace(".json", ".weights")
@@ -90,25 +121,21 @@ def setup_model_and_watchers(cfg: Any, vehicle: Any, model_path: str, model_type
 
     # Lazy import of parts that may have optional/hardware deps
     from donkeycar.parts.file_watcher import FileWatcher
-    from donkeycar.parts.transform import DelayedTrigger, TriggeredCallback
 
     # this part will signal visual LED, if connected
     vehicle.add(FileWatcher(model_path, verbose=True),
                 outputs=["modelfile/modified"])
 
-    # these parts will reload the model file, but only when ai is running
+    # this part will reload the model file, but only when ai is running
     # so we don't interrupt user driving
-    vehicle.add(FileWatcher(model_path), outputs=[
-                "modelfile/dirty"], run_condition="ai_running")
-    vehicle.add(DelayedTrigger(100), inputs=[
-                "modelfile/dirty"], outputs=["modelfile/reload"], run_condition="ai_running")
-    vehicle.add(TriggeredCallback(model_path, model_reload_cb), inputs=[
-                "modelfile/reload"], run_condition="ai_running")
+    vehicle.add(_ModelReloader(model_path, model_reload_cb),
+                inputs=["modelfile/modified", "ai_running"])
 
     outputs = ["pilot/angle", "pilot/throttle"]
     if getattr(cfg, "TRAIN_LOCALIZER", False):
         outputs.append("pilot/loc")
 
+    pilot_inputs = ["cam/image_array"]
     # Add image transformations like crop or trapezoidal mask
     if hasattr(cfg, "TRANSFORMATIONS") and cfg.TRANSFORMATIONS:
         from donkeycar.pipeline.augmentations import ImageAugmentation
@@ -118,7 +145,8 @@ def setup_model_and_watchers(cfg: Any, vehicle: Any, model_path: str, model_type
             inputs=["cam/image_array"],
             outputs=["cam/image_array_trans"],
         )
-        _inputs = ["cam/image_array_trans"] + ["cam/image_array"][1:]
+        # the pilot drives on the transformed image, as it was trained on
+        pilot_inputs = ["cam/image_array_trans"]
 
-    vehicle.add(kl, inputs=["cam/image_array"],
+    vehicle.add(kl, inputs=pilot_inputs,
                 outputs=outputs, run_condition="run_pilot")
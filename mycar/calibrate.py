@@ -13,10 +13,18 @@ Options:
 from socket import gethostname
 from docopt import docopt
 import donkeycar as dk
-from donkeycar.parts.actuator import PCA9685, PWMSteering, PWMThrottle, PulseController
 from donkeycar.parts.controller import LocalWebController
 from donkeycar.parts.throttle_filter import ThrottleFilter
-from donkeycar.parts import pins
+
+
+def _add_steering_throttle(vehicle, steering, throttle):
+    """
+    Add the steering and throttle parts to the vehicle and return them as
+    the drive train the calibration web controller adjusts.
+    """
+    vehicle.add(steering, inputs=["angle"], threaded=True)
+    vehicle.add(throttle, inputs=["throttle"], threaded=True)
+    return {"steering": steering, "throttle": throttle}
 
 
 def drive(config):
@@ -57,6 +65,11 @@ def drive(config):
         # using a PwmPin for steering (servo)
         # and as second PwmPin for throttle (ESC)
         #
+        # drive train parts are imported only for the selected drive train
+        from donkeycar.parts.actuator import PWMSteering, PWMThrottle, \
+            PulseController
+        from donkeycar.parts import pins
+
         dt = config.PWM_STEERING_THROTTLE
         steering_controller = PulseController(
             pwm_pin=pins.pwm_pin_by_id(dt["PWM_STEERING_PIN"]),
@@ -81,13 +94,11 @@ def drive(config):
             min_pulse=dt["THROTTLE_REVERSE_PWM"],
         )
 
-        drive_train = {}
-        drive_train["steering"] = steering
-        drive_train["throttle"] = throttle
+        drive_train = _add_steering_throttle(vehicle, steering, throttle)
 
-        vehicle.add(steering, inputs=["angle"], threaded=True)
-        vehicle.add(throttle, inputs=["throttle"], threaded=True)
     elif config.DRIVE_TRAIN_TYPE == "I2C_SERVO":
+        from donkeycar.parts.actuator import PCA9685, PWMSteering, PWMThrottle
+
         steering_controller = PCA9685(
             config.STEERING_CHANNEL,
             config.PCA9685_I2C_ADDR,
@@ -111,12 +122,7 @@ def drive(config):
             min_pulse=config.THROTTLE_REVERSE_PWM,
         )
 
-        drive_train = {}
-        drive_train["steering"] = steering
-        drive_train["throttle"] = throttle
-        vehicle.add(steering, inputs=["angle"], threaded=True)
-        vehicle.add(throttle, inputs=["throttle"], threaded=True)
-        vehicle.add(throttle, inputs=["throttle"], threaded=True)
+        drive_train = _add_steering_throttle(vehicle, steering, throttle)
 
     elif config.DRIVE_TRAIN_TYPE == "MM1":
         from donkeycar.parts.robohat import RoboHATDriver
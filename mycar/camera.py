@@ -10,7 +10,7 @@ values used by the rest of the wiring.
 # (hardware deps). Silence import-error and keep this module safe on CI.
 # pylint: disable=import-error,too-many-lines
 
-from typing import Tuple, Any, List
+from typing import Any, Callable, Dict, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -79,87 +79,112 @@ def setup_dgym_camera(cfg: Any, vehicle: Any) -> Tuple[List[str], List[str], boo
     return ["angle", "throttle"], ["cam/image_array"], True
 
 
-def setup_single_camera(cfg: Any, vehicle: Any) -> Tuple[List[str], List[str], bool]:
-    """Configure a single camera variant and attach to vehicle."""
-    inputs: List[str] = []
-    outputs: List[str] = ["cam/image_array"]
-    threaded = True
+def _build_picam(cfg: Any) -> Any:
+    from donkeycar.parts.camera import PiCamera
 
-    if cfg.CAMERA_TYPE == "PICAM":
-        from donkeycar.parts.camera import PiCamera
+    return PiCamera(
+        image_w=cfg.IMAGE_W,
+        image_h=cfg.IMAGE_H,
+        image_d=cfg.IMAGE_DEPTH,
+        framerate=cfg.CAMERA_FRAMERATE,
+        vflip=cfg.CAMERA_VFLIP,
+        hflip=cfg.CAMERA_HFLIP,
+    )
 
-        cam = PiCamera(
-            image_w=cfg.IMAGE_W,
-            image_h=cfg.IMAGE_H,
-            image_d=cfg.IMAGE_DEPTH,
-            framerate=cfg.CAMERA_FRAMERATE,
-            vflip=cfg.CAMERA_VFLIP,
-            hflip=cfg.CAMERA_HFLIP,
-        )
 
-    elif cfg.CAMERA_TYPE == "WEBCAM":
-        from donkeycar.parts.camera import Webcam
+def _build_webcam(cfg: Any) -> Any:
+    from donkeycar.parts.camera import Webcam
 
-        cam = Webcam(
-            image_w=cfg.IMAGE_W,
-            image_h=cfg.IMAGE_H,
-            image_d=cfg.IMAGE_DEPTH,
-            camera_index=cfg.CAMERA_INDEX,
-        )
+    return Webcam(
+        image_w=cfg.IMAGE_W,
+        image_h=cfg.IMAGE_H,
+        image_d=cfg.IMAGE_DEPTH,
+        camera_index=cfg.CAMERA_INDEX,
+    )
 
-    elif cfg.CAMERA_TYPE == "CVCAM":
-        from donkeycar.parts.cv import CvCam
 
-        cam = CvCam(
-            image_w=cfg.IMAGE_W,
-            image_h=cfg.IMAGE_H,
-            image_d=cfg.IMAGE_DEPTH,
-            iCam=cfg.CAMERA_INDEX,
-        )
+def _build_cvcam(cfg: Any) -> Any:
+    from donkeycar.parts.cv import CvCam
 
-    elif cfg.CAMERA_TYPE == "CSIC":
-        from donkeycar.parts.camera import CSICamera
-
-        cam = CSICamera(
-            image_w=cfg.IMAGE_W,
-            image_h=cfg.IMAGE_H,
-            image_d=cfg.IMAGE_DEPTH,
-            framerate=cfg.CAMERA_FRAMERATE,
-            capture_width=cfg.IMAGE_W,
-            capture_height=cfg.IMAGE_H,
-            gstreamer_flip=cfg.CSIC_CAM_GSTREAMER_FLIP_PARM,
-        )
+    return CvCam(
+        image_w=cfg.IMAGE_W,
+        image_h=cfg.IMAGE_H,
+        image_d=cfg.IMAGE_DEPTH,
+        iCam=cfg.CAMERA_INDEX,
+    )
 
-    elif cfg.CAMERA_TYPE == "V4L":
-        from donkeycar.parts.camera import V4LCamera
 
-        cam = V4LCamera(
-            image_w=cfg.IMAGE_W,
-            image_h=cfg.IMAGE_H,
-            image_d=cfg.IMAGE_DEPTH,
-            framerate=cfg.CAMERA_FRAMERATE,
-        )
+def _build_csic(cfg: Any) -> Any:
+    from donkeycar.parts.camera import CSICamera
 
-    elif cfg.CAMERA_TYPE == "MOCK":
-        from donkeycar.parts.camera import MockCamera
+    return CSICamera(
+        image_w=cfg.IMAGE_W,
+        image_h=cfg.IMAGE_H,
+        image_d=cfg.IMAGE_DEPTH,
+        framerate=cfg.CAMERA_FRAMERATE,
+        capture_width=cfg.IMAGE_W,
+        capture_height=cfg.IMAGE_H,
+        gstreamer_flip=cfg.CSIC_CAM_GSTREAMER_FLIP_PARM,
+    )
 
-        cam = MockCamera(
-            image_w=cfg.IMAGE_W, image_h=cfg.IMAGE_H, image_d=cfg.IMAGE_DEPTH
-        )
 
-    elif cfg.CAMERA_TYPE == "IMAGE_LIST":
-        from donkeycar.parts.camera import ImageListCamera
+def _build_v4l(cfg: Any) -> Any:
+    from donkeycar.parts.camera import V4LCamera
 
-        cam = ImageListCamera(path_mask=cfg.PATH_MASK)
+    return V4LCamera(
+        image_w=cfg.IMAGE_W,
+        image_h=cfg.IMAGE_H,
+        image_d=cfg.IMAGE_DEPTH,
+        framerate=cfg.CAMERA_FRAMERATE,
+    )
 
-    elif cfg.CAMERA_TYPE == "LEOPARD":
-        from donkeycar.parts.leopard_imaging import LICamera
 
-        cam = LICamera(width=cfg.IMAGE_W, height=cfg.IMAGE_H,
-                       fps=cfg.CAMERA_FRAMERATE)
+def _build_mock(cfg: Any) -> Any:
+    from donkeycar.parts.camera import MockCamera
 
-    else:
-        raise ValueError(f"Unknown camera type: {cfg.CAMERA_TYPE}")
+    return MockCamera(
+        image_w=cfg.IMAGE_W, image_h=cfg.IMAGE_H, image_d=cfg.IMAGE_DEPTH
+    )
+
+
+def _build_image_list(cfg: Any) -> Any:
+    from donkeycar.parts.camera import ImageListCamera
+
+    return ImageListCamera(path_mask=cfg.PATH_MASK)
+
+
+def _build_leopard(cfg: Any) -> Any:
+    from donkeycar.parts.leopard_imaging import LICamera
+
+    return LICamera(width=cfg.IMAGE_W, height=cfg.IMAGE_H,
+                    fps=cfg.CAMERA_FRAMERATE)
+
+
+# CAMERA_TYPE -> builder. The builders import their camera part lazily so
+# only the hardware module of the selected camera is loaded.
+_CAMERA_BUILDERS: Dict[str, Callable[[Any], Any]] = {
+    "PICAM": _build_picam,
+    "WEBCAM": _build_webcam,
+    "CVCAM": _build_cvcam,
+    "CSIC": _build_csic,
+    "V4L": _build_v4l,
+    "MOCK": _build_mock,
+    "IMAGE_LIST": _build_image_list,
+    "LEOPARD": _build_leopard,
+}
+
+
+def setup_single_camera(cfg: Any, vehicle: Any) -> Tuple[List[str], List[str], bool]:
+    """Configure a single camera variant and attach to vehicle."""
+    inputs: List[str] = []
+    outputs: List[str] = ["cam/image_array"]
+    threaded = True
+
+    try:
+        build_camera = _CAMERA_BUILDERS[cfg.CAMERA_TYPE]
+    except KeyError:
+        raise ValueError(f"Unknown camera type: {cfg.CAMERA_TYPE}") from None
+    cam = build_camera(cfg)
 
     # Donkey gym augmentation of outputs is handled by the DGym helper
     # when used; here we just attach the camera instance.
@@ -1,18 +1,42 @@
 """Controller wiring helper for `mycar.manage.drive`.
 
 This module centralizes controller selection and wiring so that
-`manage.py` remains small and easier to lint. Imports that may require
-optional dependencies are performed lazily inside the function.
+`manage.py` remains small and easier to lint. The controller classes,
+which may require optional dependencies, are imported on first use.
 # Pylint: some of these helper modules are imported lazily and certain
 # broad-except catches are intentional in wiring code that must be
 # resilient to missing hardware. Suppress the related warning here.
 # pylint: disable=broad-except
 """
-from typing import Any, Optional
+from typing import Any, Dict, Optional
+import importlib
 import logging
+import sys
+
+__all__ = ["setup_controller", "LocalWebController", "JoystickController",
+           "RCReceiver"]
 
 logger = logging.getLogger(__name__)
 
+# The controller classes are exposed as lazy module attributes (PEP 562) so
+# that importing this module does not import donkeycar.parts.controller
+# and with it tornado / pygame.
+_LAZY_NAMES = frozenset(("LocalWebController", "JoystickController",
+                         "RCReceiver"))
+_lazy_cache: Dict[str, Any] = {}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        return _lazy_cache[name]
+    except KeyError:
+        pass
+    parts_controller = importlib.import_module("donkeycar.parts.controller")
+    value = _lazy_cache[name] = getattr(parts_controller, name)
+    return value
+
 
 def setup_controller(cfg: Any, vehicle: Any, use_joystick: bool = False) -> Optional[object]:
     """Configure and add controller parts to `vehicle`.
@@ -20,23 +44,19 @@ def setup_controller(cfg: Any, vehicle: Any, use_joystick: bool = False) -> Opti
     Returns the controller instance (or ``None`` if unavailable).
     """
     ctr = None
-    try:
-        # import the common controller classes; these imports may fail on
-        # minimal environments so catch broadly and fall back to None.
-        from donkeycar.parts.controller import (
-            LocalWebController,
-            JoystickController,
-        )
-    except ImportError as exc:
-        logger.debug("Controller parts not available: %s", exc)
-        LocalWebController = JoystickController = object
+    # the controller classes are resolved through the lazy module
+    # attributes, so only the branch actually taken imports them
+    module = sys.modules[__name__]
+    controller_type = getattr(cfg, "CONTROLLER_TYPE", "").lower()
+    web_port = getattr(cfg, "WEB_CONTROL_PORT", 8887)
+    web_mode = getattr(cfg, "WEB_INIT_MODE", None)
 
     # Prefer an attached joystick if requested and available
     if use_joystick:
         try:
             # Many joystick implementations accept different constructor
             # arguments; create with no-args and let them autodetect.
-            ctr = JoystickController()
+            ctr = module.JoystickController()
             vehicle.add(
                 ctr,
                 outputs=["user/angle", "user/throttle",
@@ -44,16 +64,15 @@ def setup_controller(cfg: Any, vehicle: Any, use_joystick: bool = False) -> Opti
                 threaded=True,
             )
             return ctr
-        except (RuntimeError, OSError, ValueError, TypeError) as exc:
+        except (ImportError, RuntimeError, OSError, ValueError,
+                TypeError) as exc:
             logger.debug("Joystick controller not available: %s", exc)
             ctr = None
 
     # If configuration requests an RC controller type, prefer that first
     try:
-        if getattr(cfg, "CONTROLLER_TYPE", "").lower() in ("pigpio_rc", "rc"):
-            from donkeycar.parts.controller import RCReceiver
-
-            rc = RCReceiver(cfg)
+        if controller_type in ("pigpio_rc", "rc"):
+            rc = module.RCReceiver(cfg)
             vehicle.add(
                 rc,
                 outputs=["user/angle", "user/throttle",
@@ -66,9 +85,9 @@ def setup_controller(cfg: Any, vehicle: Any, use_joystick: bool = False) -> Opti
 
     # Otherwise try local web controller as the default
     try:
-        ctr = LocalWebController(
-            port=getattr(cfg, "WEB_CONTROL_PORT", 8887),
-            mode=getattr(cfg, "WEB_INIT_MODE", None),
+        ctr = module.LocalWebController(
+            port=web_port,
+            mode=web_mode,
         )
         vehicle.add(
             ctr,
@@ -76,7 +95,7 @@ def setup_controller(cfg: Any, vehicle: Any, use_joystick: bool = False) -> Opti
             threaded=True,
         )
         return ctr
-    except (RuntimeError, OSError, ValueError, TypeError) as exc:
+    except (ImportError, RuntimeError, OSError, ValueError, TypeError) as exc:
         logger.debug("Local web controller not available: %s", exc)
 
     return None
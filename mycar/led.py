@@ -9,16 +9,28 @@ RGB LED logic and a small record-tracker part that emits alert colors.
 # safe on CI/dev machines without hardware deps.
 # pylint: disable=import-error,too-many-lines
 
-from typing import Any, Tuple
+from bisect import bisect_right
+from typing import Any, List, Tuple
+
+
+def _alert_thresholds(color_arr) -> Tuple[List[int], List[Tuple[int, int, int]]]:
+    """Split `RECORD_ALERT_COLOR_ARR` into sorted thresholds and colors."""
+    # stable sort, so on equal counts the later entry still wins
+    arr = sorted(color_arr, key=lambda entry: entry[0])
+    return [count for count, _ in arr], [color for _, color in arr]
+
+
+def _lookup_alert_color(thresholds: List[int], colors: List[Tuple[int, int, int]],
+                        num_records: int) -> Tuple[int, int, int]:
+    """Color of the highest threshold not above `num_records`."""
+    idx = bisect_right(thresholds, num_records) - 1
+    return colors[idx] if idx >= 0 else (0, 0, 0)
 
 
 def get_record_alert_color(cfg: Any, num_records: int) -> Tuple[int, int, int] | int:
     """Return the alert color tuple for the given recorded count."""
-    col = (0, 0, 0)
-    for count, color in cfg.RECORD_ALERT_COLOR_ARR:
-        if num_records >= count:
-            col = color
-    return col
+    thresholds, colors = _alert_thresholds(cfg.RECORD_ALERT_COLOR_ARR)
+    return _lookup_alert_color(thresholds, colors, num_records)
 
 
 class RecordTracker:
@@ -30,32 +42,39 @@ class RecordTracker:
         self.last_num_rec_print = 0
         self.dur_alert = 0
         self.force_alert = 0
+        # run() is called every frame, look the alert color up by bisection
+        self._thresholds, self._colors = _alert_thresholds(
+            cfg.RECORD_ALERT_COLOR_ARR)
 
     def run(self, num_records: int):
         """Update internal counters and return alert color or 0."""
         if num_records is None:
             return 0
 
-        if self.last_num_rec_print != num_records or self.force_alert:
-            self.last_num_rec_print = num_records
-
-            if num_records % 10 == 0:
-                # logging should happen in parts; avoid depending on external logger
-                pass
+        # steady state: the count did not change and no alert is forced
+        if num_records == self.last_num_rec_print and not self.force_alert:
+            if self.dur_alert > 0:
+                self.dur_alert -= 1
+                if self.dur_alert != 0:
+                    return _lookup_alert_color(self._thresholds, self._colors,
+                                               num_records)
+            return 0
 
-            if num_records % self.cfg.REC_COUNT_ALERT == 0 or self.force_alert:
-                self.dur_alert = (
-                    num_records
-                    // self.cfg.REC_COUNT_ALERT
-                    * self.cfg.REC_COUNT_ALERT_CYC
-                )
-                self.force_alert = 0
+        self.last_num_rec_print = num_records
+        if num_records % self.cfg.REC_COUNT_ALERT == 0 or self.force_alert:
+            self.dur_alert = (
+                num_records
+                // self.cfg.REC_COUNT_ALERT
+                * self.cfg.REC_COUNT_ALERT_CYC
+            )
+            self.force_alert = 0
 
         if self.dur_alert > 0:
             self.dur_alert -= 1
 
         if self.dur_alert != 0:
-            return get_record_alert_color(self.cfg, num_records)
+            return _lookup_alert_color(self._thresholds, self._colors,
+                                       num_records)
 
         return 0
 
@@ -71,6 +90,13 @@ class LedConditionLogic:
         self.cfg = cfg
         self.led = None
         self.model_type = None
+        # run() is called every frame, read the fixed colors once
+        self._default_rgb = (cfg.LED_R, cfg.LED_G, cfg.LED_B)
+        self._reloaded_rgb = (
+            cfg.MODEL_RELOADED_LED_R,
+            cfg.MODEL_RELOADED_LED_G,
+            cfg.MODEL_RELOADED_LED_B,
+        )
 
     def run(
         self,
@@ -82,34 +108,32 @@ class LedConditionLogic:
         track_loc,
     ):
         """Return blink rate (0=off, -1=solid, >0 blink rate)."""
+        led = self.led
+        cfg = self.cfg
 
         if track_loc is not None:
-            if self.led is not None:
-                self.led.set_rgb(*self.cfg.LOC_COLORS[track_loc])
+            if led is not None:
+                led.set_rgb(*cfg.LOC_COLORS[track_loc])
             return -1
 
         if model_file_changed:
-            if self.led is not None:
-                self.led.set_rgb(
-                    self.cfg.MODEL_RELOADED_LED_R,
-                    self.cfg.MODEL_RELOADED_LED_G,
-                    self.cfg.MODEL_RELOADED_LED_B,
-                )
+            if led is not None:
+                led.set_rgb(*self._reloaded_rgb)
             return 0.1
-        if self.led is not None:
-            self.led.set_rgb(self.cfg.LED_R, self.cfg.LED_G, self.cfg.LED_B)
+        if led is not None:
+            led.set_rgb(*self._default_rgb)
 
         if recording_alert:
-            if self.led is not None:
-                self.led.set_rgb(*recording_alert)
-            return self.cfg.REC_COUNT_ALERT_BLINK_RATE
-        if self.led is not None:
-            self.led.set_rgb(self.cfg.LED_R, self.cfg.LED_G, self.cfg.LED_B)
+            if led is not None:
+                led.set_rgb(*recording_alert)
+            return cfg.REC_COUNT_ALERT_BLINK_RATE
+        if led is not None:
+            led.set_rgb(*self._default_rgb)
 
         if behavior_state is not None and self.model_type == "behavior":
-            r, g, b = self.cfg.BEHAVIOR_LED_COLORS[behavior_state]
-            if self.led is not None:
-                self.led.set_rgb(r, g, b)
+            r, g, b = cfg.BEHAVIOR_LED_COLORS[behavior_state]
+            if led is not None:
+                led.set_rgb(r, g, b)
             return -1  # solid on
 
         if recording:
@@ -130,8 +154,10 @@ def setup_led(cfg: Any, vehicle: Any, model_type: str | None = None):
     with the created parts (for example hooking up a button trigger).
     """
     led = None
+    have_rgb_led = getattr(cfg, "HAVE_RGB_LED", False)
+    donkey_gym = getattr(cfg, "DONKEY_GYM", False)
 
-    if getattr(cfg, "HAVE_RGB_LED", False) and not getattr(cfg, "DONKEY_GYM", False):
+    if have_rgb_led and not donkey_gym:
         from donkeycar.parts.led_status import RGB_LED
 
         led = RGB_LED(cfg.LED_PIN_R, cfg.LED_PIN_G,
@@ -0,0 +1,63 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+from mycar.ai import _ModelReloader
+
+DELAY = 3
+
+
+@pytest.fixture
+def reloader(monkeypatch):
+    # the real trigger parts, loaded from their file as the donkeycar
+    # package is faked in this directory
+    path = Path(__file__).parents[1] / "donkeycar" / "parts" / "transform.py"
+    spec = importlib.util.spec_from_file_location(
+        "donkeycar.parts.transform", path)
+    transform = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(transform)
+    monkeypatch.setitem(sys.modules, "donkeycar.parts.transform", transform)
+
+    calls = []
+    part = _ModelReloader("model.h5", calls.append, delay=DELAY)
+    return part, calls
+
+
+def test_nothing_fires_while_ai_is_off(reloader):
+    part, calls = reloader
+    part.run(True, False)
+    for _ in range(2 * DELAY):
+        part.run(False, False)
+    part.run(True, False)
+    assert calls == []
+
+
+def test_change_while_ai_off_is_latched_and_fires_once(reloader):
+    part, calls = reloader
+    part.run(True, False)
+    part.run(False, False)
+    assert calls == []
+
+    # ai starts: the latched change starts the delay on the first tick
+    part.run(False, True)
+    for _ in range(DELAY - 1):
+        part.run(False, True)
+        assert calls == []
+    part.run(False, True)
+    assert calls == ["model.h5"]
+
+    for _ in range(2 * DELAY):
+        part.run(False, True)
+    assert calls == ["model.h5"]
+
+
+def test_change_while_ai_runs_fires_after_delay(reloader):
+    part, calls = reloader
+    part.run(True, True)
+    for _ in range(DELAY - 1):
+        part.run(False, True)
+    assert calls == []
+    part.run(False, True)
+    assert calls == ["model.h5"]
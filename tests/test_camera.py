@@ -1,3 +1,4 @@
+import sys
 from types import SimpleNamespace
 
 import pytest
@@ -20,3 +21,22 @@ def test_setup_single_camera_unknown_type_raises():
 
     with pytest.raises(ValueError):
         setup_single_camera(cfg, vehicle=SimpleNamespace(add=lambda *a, **k: None))
+
+
+def test_setup_single_camera_dispatches_on_type(monkeypatch):
+    class FakeMockCamera:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    monkeypatch.setitem(sys.modules, "donkeycar.parts.camera",
+                        SimpleNamespace(MockCamera=FakeMockCamera))
+    cfg = SimpleNamespace(CAMERA_TYPE="MOCK", IMAGE_W=4, IMAGE_H=3,
+                          IMAGE_DEPTH=3)
+    added = []
+
+    inputs, outputs, threaded = setup_single_camera(
+        cfg, vehicle=SimpleNamespace(add=lambda *a, **k: added.append(a[0])))
+
+    assert isinstance(added[0], FakeMockCamera)
+    assert added[0].kwargs == {"image_w": 4, "image_h": 3, "image_d": 3}
+    assert (inputs, outputs, threaded) == ([], ["cam/image_array"], True)
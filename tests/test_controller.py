@@ -98,3 +98,20 @@ def test_setup_controller_rc_receiver_selected_for_rc_type():
     finally:
         sys.modules.clear()
         sys.modules.update(sys_modules_backup)
+
+
+def test_controller_classes_are_lazy_module_attributes():
+    mod, FakeJoystick, *_ = _make_fake_controller_module()
+    sys_modules_backup = dict(sys.modules)
+    try:
+        sys.modules.pop("donkeycar.parts.controller", None)
+        import mycar.controller as controller
+        importlib.reload(controller)
+        assert "donkeycar.parts.controller" not in sys.modules
+
+        sys.modules["donkeycar.parts.controller"] = mod
+        assert controller.JoystickController is FakeJoystick
+        assert "JoystickController" in controller.__all__
+    finally:
+        sys.modules.clear()
+        sys.modules.update(sys_modules_backup)
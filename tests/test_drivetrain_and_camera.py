@@ -53,6 +53,34 @@ def test_setup_drivetrain_noop_in_sim_or_mock():
     assert v2.add_calls == []
 
 
+def test_setup_drivetrain_dispatches_on_type(monkeypatch):
+    class FakeVESC:
+        def __init__(self, *args):
+            self.args = args
+
+    monkeypatch.setitem(sys.modules, "donkeycar.parts.actuator",
+                        SimpleNamespace(VESC=FakeVESC))
+    cfg = SimpleNamespace(
+        DONKEY_GYM=False, DRIVE_TRAIN_TYPE="VESC", VESC_SERIAL_PORT="/dev/x",
+        VESC_MAX_SPEED_PERCENT=0.2, VESC_HAS_SENSOR=True,
+        VESC_START_HEARTBEAT=True, VESC_BAUDRATE=115200, VESC_TIMEOUT=0.05,
+        VESC_STEERING_SCALE=0.5, VESC_STEERING_OFFSET=0.5,
+    )
+    v = FakeVehicle()
+    drivetrain.setup_drivetrain(cfg, v)
+
+    (part, kwargs), = v.add_calls
+    assert isinstance(part, FakeVESC)
+    assert part.args[0] == "/dev/x"
+    assert kwargs == {"inputs": ["angle", "throttle"]}
+
+    # unknown drive trains add nothing
+    v2 = FakeVehicle()
+    drivetrain.setup_drivetrain(
+        SimpleNamespace(DONKEY_GYM=False, DRIVE_TRAIN_TYPE="FOOBAR"), v2)
+    assert v2.add_calls == []
+
+
 def test_setup_camera_delegates_to_dgym(monkeypatch):
     # Provide a fake DonkeyGymEnv so we don't import the real simulator
     class FakeDGym:
@@ -1,6 +1,6 @@
 import types
 
-from mycar.led import get_record_alert_color, LedConditionLogic
+from mycar.led import get_record_alert_color, LedConditionLogic, RecordTracker
 
 
 class Cfg:
@@ -23,6 +23,42 @@ def test_get_record_alert_color_basic():
     # above second threshold => second color
     assert get_record_alert_color(cfg, 2000) == (5, 5, 5)
 
+    # exactly on a threshold => that threshold's color
+    assert get_record_alert_color(cfg, 1000) == (5, 5, 5)
+
+
+def test_get_record_alert_color_unsorted_and_below_all():
+    cfg = Cfg()
+    cfg.RECORD_ALERT_COLOR_ARR = [(1000, (5, 5, 5)), (10, (1, 1, 1))]
+    assert get_record_alert_color(cfg, 5) == (0, 0, 0)
+    assert get_record_alert_color(cfg, 500) == (1, 1, 1)
+    assert get_record_alert_color(cfg, 1500) == (5, 5, 5)
+
+
+def test_record_tracker_alerts_with_threshold_color():
+    cfg = Cfg()
+    cfg.REC_COUNT_ALERT_CYC = 2
+    tracker = RecordTracker(cfg)
+
+    assert tracker.run(None) == 0
+    assert tracker.run(99) == 0
+    # 1000 records is a multiple of REC_COUNT_ALERT, alert for 10 * 2 frames
+    assert tracker.run(1000) == (5, 5, 5)
+    assert tracker.dur_alert == 19
+
+    # unchanged count keeps alerting until the duration runs out
+    for remaining in range(18, 0, -1):
+        assert tracker.run(1000) == (5, 5, 5)
+        assert tracker.dur_alert == remaining
+    assert tracker.run(1000) == 0
+    assert tracker.run(1000) == 0
+    assert tracker.dur_alert == 0
+
+    # a forced alert fires again without a change in count
+    tracker.force_alert = 1
+    assert tracker.run(1000) == (5, 5, 5)
+    assert tracker.force_alert == 0
+
 
 def test_led_condition_logic_returns_expected_rates():
     cfg = Cfg()